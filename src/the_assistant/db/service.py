@@ -126,26 +126,37 @@ class UserService:
 
     async def set_setting(self, user_id: int, key: SettingKey, value: Any) -> None:
         """Set or update a user setting with validation."""
-        schema = cast(Any, SETTING_SCHEMAS[key])
-        validated = schema.model_validate(value)
-        payload = validated.model_dump()
+        await self.set_settings(user_id, {key: value})
+
+    async def set_settings(self, user_id: int, values: dict[SettingKey, Any]) -> None:
+        """Set or update several user settings in a single transaction."""
+        payloads: dict[str, str] = {}
+        for key, value in values.items():
+            schema = cast(Any, SETTING_SCHEMAS[key])
+            validated = schema.model_validate(value)
+            payloads[key.value] = json.dumps(validated.model_dump())
 
         async with self._session_maker() as session:
             stmt = select(UserSetting).where(
-                UserSetting.user_id == user_id, UserSetting.key == key.value
+                UserSetting.user_id == user_id, UserSetting.key.in_(list(payloads))
             )
             result = await session.execute(stmt)
-            setting = result.scalar_one_or_none()
-            if setting:
-                setting.value_json = json.dumps(payload)
-            else:
-                setting = UserSetting(
-                    user_id=user_id,
-                    key=key.value,
-                    value_json=json.dumps(payload),
-                )
-                session.add(setting)
-            await session.commit()
+            existing = {setting.key: setting for setting in result.scalars()}
+            changed = False
+            for name, value_json in payloads.items():
+                setting = existing.get(name)
+                if setting is None:
+                    session.add(
+                        UserSetting(user_id=user_id, key=name, value_json=value_json)
+                    )
+                elif setting.value_json != value_json:
+                    setting.value_json = value_json
+                else:
+                    # Unchanged value: nothing to write.
+                    continue
+                changed = True
+            if changed:
+                await session.commit()
 
     async def get_setting(self, user_id: int, key: SettingKey) -> Any | None:
         """Return a single user setting value or ``None`` if missing."""
@@ -5,6 +5,7 @@ import logging
 import time
 from collections.abc import Awaitable, Callable
 from datetime import UTC, datetime
+from functools import cached_property
 from typing import Any, cast
 
 from telegram import (
@@ -85,7 +86,6 @@ class TelegramClient:
 
         self.token = token
         self.user_id = user_id
-        self.bot = Bot(token=token)
         self.application: Application | None = None
         self._command_handlers: dict[
             str, Callable[[Update, ContextTypes.DEFAULT_TYPE], Awaitable[None]]
@@ -94,6 +94,11 @@ class TelegramClient:
 
         logger.info(f"Telegram client initialized for user_id: {user_id}")
 
+    @cached_property
+    def bot(self) -> Bot:
+        """The Bot API client, created on first use."""
+        return Bot(token=self.token)
+
     async def validate_credentials(self) -> bool:
         """Validate the bot token by getting the bot info.
 
@@ -171,6 +176,24 @@ class TelegramClient:
 
         logger.info(f"Registered handler for command: /{command}")
 
+    async def register_command_handlers(
+        self,
+        handlers: dict[
+            str, Callable[[Update, ContextTypes.DEFAULT_TYPE], Awaitable[None]]
+        ],
+    ) -> None:
+        """Register several command handlers at once.
+
+        Args:
+            handlers: Mapping of command (without the leading slash) to handler.
+                Descriptions are taken from COMMAND_REGISTRY.
+        """
+        self._command_handlers.update(handlers)
+        logger.info(
+            "Registered handlers for commands: "
+            + ", ".join(f"/{command}" for command in handlers)
+        )
+
     async def register_handler(self, handler: ConversationHandler) -> None:
         """Register a generic Telegram handler."""
 
@@ -1211,26 +1234,27 @@ async def create_telegram_client() -> TelegramClient:
 
     # Register all command handlers from COMMAND_REGISTRY
     # Note: Descriptions are automatically taken from COMMAND_REGISTRY
-    await client.register_command_handler("start", handle_start_command)
-    await client.register_command_handler("help", handle_help_command)
-    await client.register_command_handler("briefing", handle_briefing_command)
-    await client.register_command_handler("settings", handle_settings_command)
-    await client.register_command_handler("google_auth", handle_google_auth_command)
-    await client.register_command_handler("ignore_email", handle_ignore_email_command)
-    await client.register_command_handler("list_ignored", handle_list_ignored_command)
-    await client.register_command_handler("status", handle_status_command)
-    await client.register_command_handler("memory_add", handle_memory_add_command)
-    await client.register_command_handler("memory", handle_memory_command)
-    await client.register_command_handler(
-        "memories", handle_memory_command
-    )  # Alias for memory
-    await client.register_command_handler("add_task", handle_add_task_command)
-    await client.register_command_handler("add_countdown", handle_add_countdown_command)
-
-    # Register conversation entry points as commands for menu visibility
-    # These will be handled by conversation handlers but need to be in the command menu
-    await client.register_command_handler("update_settings", start_update_settings)
-    await client.register_command_handler("memory_delete", start_memory_delete)
+    await client.register_command_handlers(
+        {
+            "start": handle_start_command,
+            "help": handle_help_command,
+            "briefing": handle_briefing_command,
+            "settings": handle_settings_command,
+            "google_auth": handle_google_auth_command,
+            "ignore_email": handle_ignore_email_command,
+            "list_ignored": handle_list_ignored_command,
+            "status": handle_status_command,
+            "memory_add": handle_memory_add_command,
+            "memory": handle_memory_command,
+            "memories": handle_memory_command,  # Alias for memory
+            "add_task": handle_add_task_command,
+            "add_countdown": handle_add_countdown_command,
+            # Conversation entry points, registered as commands for menu
+            # visibility; the conversation handlers below do the actual work
+            "update_settings": start_update_settings,
+            "memory_delete": start_memory_delete,
+        }
+    )
 
     # Settings conversation handler
     settings_conv_handler = ConversationHandler(
@@ -5,7 +5,10 @@ This module contains all data structures for Obsidian integration,
 including notes, tasks, headings, links, and filtering options.
 """
 
+import calendar
+import re
 from datetime import date, datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Literal
 
@@ -13,6 +16,71 @@ from pydantic import Field, computed_field, field_validator
 
 from .base import BaseAssistantModel
 
+# Date layouts accepted in note metadata, matched with one regex each instead
+# of trying strptime formats in turn:
+#   2024-01-15, 2024/01/15
+#   01/15/2024, 15/01/2024 (month first when ambiguous)
+#   15-01-2024, 01-15-2024 (day first when ambiguous)
+#   January 15, 2024 / Jan 15, 2024
+#   15 January 2024 / 15 Jan 2024
+# As with strptime's %d, a one-digit day may be space-padded (2024-01- 5).
+# Digits, month names and whitespace are ASCII only.
+_NUMERIC_DATE_RE = re.compile(
+    r"(?P<iso_y>\d{4})(?P<iso_sep>[-/])(?P<iso_m>\d{1,2})(?P=iso_sep)(?P<iso_d> ?\d{1,2})"
+    r"|(?P<a> ?\d{1,2})(?P<sep>[-/])(?P<b> ?\d{1,2})(?P=sep)(?P<y>\d{4})",
+    re.ASCII,
+)
+_NAMED_DATE_RE = re.compile(
+    r"(?P<md_month>[a-z]+)\s+(?P<md_d>\d{1,2}),\s+(?P<md_y>\d{4})"
+    r"|(?P<dm_d>\d{1,2})\s+(?P<dm_month>[a-z]+)\s+(?P<dm_y>\d{4})",
+    re.ASCII | re.IGNORECASE,
+)
+_MONTHS = {
+    name.lower(): number
+    for names in (calendar.month_name, calendar.month_abbr)
+    for number, name in enumerate(names)
+    if name
+}
+
+
+def _date_or_none(year: str, month: str | int | None, day: str) -> date | None:
+    """Build a date from matched groups, or ``None`` if it does not exist."""
+    if month is None or str(month).startswith(" "):
+        return None
+    if day.startswith(" ") and len(day) != 2:
+        return None
+    y, m, d = int(year), int(month), int(day)
+    if y < 1 or not 1 <= m <= 12 or not 1 <= d <= calendar.monthrange(y, m)[1]:
+        return None
+    return date(y, m, d)
+
+
+@lru_cache(maxsize=512)
+def _parse_date_string(date_str: str) -> date | None:
+    """Parse a date string in one of the layouts listed above.
+
+    Vaults repeat the same date strings across many notes, so results
+    (including failures) are cached by the raw string.
+    """
+    date_str = date_str.strip()
+
+    if match := _NUMERIC_DATE_RE.fullmatch(date_str):
+        if match["iso_y"]:
+            return _date_or_none(match["iso_y"], match["iso_m"], match["iso_d"])
+        a, b, year = match["a"], match["b"], match["y"]
+        if match["sep"] == "/":
+            return _date_or_none(year, a, b) or _date_or_none(year, b, a)
+        return _date_or_none(year, b, a) or _date_or_none(year, a, b)
+
+    if match := _NAMED_DATE_RE.fullmatch(date_str):
+        if match["md_month"]:
+            month = _MONTHS.get(match["md_month"].lower())
+            return _date_or_none(match["md_y"], month, match["md_d"])
+        month = _MONTHS.get(match["dm_month"].lower())
+        return _date_or_none(match["dm_y"], month, match["dm_d"])
+
+    return None
+
 
 class TaskItem(BaseAssistantModel):
     """Represents a checkbox task item extracted from note content."""
@@ -190,27 +258,7 @@ class ObsidianNote(BaseAssistantModel):
 
     def _parse_date_string(self, date_str: str) -> date | None:
         """Parse a date string using common formats."""
-        # Common date formats to try
-        formats = [
-            "%Y-%m-%d",  # 2024-01-15
-            "%m/%d/%Y",  # 01/15/2024
-            "%d/%m/%Y",  # 15/01/2024
-            "%Y/%m/%d",  # 2024/01/15
-            "%d-%m-%Y",  # 15-01-2024
-            "%m-%d-%Y",  # 01-15-2024
-            "%B %d, %Y",  # January 15, 2024
-            "%b %d, %Y",  # Jan 15, 2024
-            "%d %B %Y",  # 15 January 2024
-            "%d %b %Y",  # 15 Jan 2024
-        ]
-
-        for fmt in formats:
-            try:
-                return datetime.strptime(date_str.strip(), fmt).date()
-            except ValueError:
-                continue
-
-        return None
+        return _parse_date_string(date_str)
 
     def get_tag_list(self) -> list[str]:
         """Get a normalized list of all tags from both metadata and content."""
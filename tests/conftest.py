@@ -211,12 +211,14 @@ date: 2025-01-15
 
 
 # Async test utilities
-@pytest.fixture
-def event_loop():
-    """Create an event loop for async tests."""
-    loop = asyncio.new_event_loop()
-    yield loop
-    loop.close()
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Run async tests on uvloop when it is available."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.get_event_loop_policy()
+    return uvloop.EventLoopPolicy()
 
 
 # Test categories and execution control
@@ -247,6 +249,26 @@ def pytest_collection_modifyitems(config, items):
 
 
 # Custom test utilities
+def _frozen_datetime(now: datetime) -> type[datetime]:
+    """Return a ``datetime`` subclass whose ``now`` always returns ``now``."""
+
+    class FrozenDateTime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return now if tz is None else now.astimezone(tz)
+
+    return FrozenDateTime
+
+
+@pytest.fixture(scope="session")
+def frozen_datetime():
+    """Provide a factory for ``datetime`` subclasses with a frozen clock.
+
+    Patch the result over a module's ``datetime`` name to freeze that module.
+    """
+    return _frozen_datetime
+
+
 class TestHelpers:
     """Helper utilities for tests."""
 
@@ -7,7 +7,6 @@ to task status updates.
 """
 
 import shutil
-import tempfile
 from pathlib import Path
 
 import pytest
@@ -23,19 +22,16 @@ class TestTaskManagementIntegration:
     """Integration tests for task management with real vault notes."""
 
     @pytest.fixture
-    def temp_vault_path(self):
+    def temp_vault_path(self, tmp_path):
         """Create a temporary copy of the example vault for testing."""
-        # Create temporary directory
-        temp_dir = Path(tempfile.mkdtemp())
-
         # Copy example vault to temp directory
         source_vault = Path("obsidian_vault")
         if source_vault.exists():
-            shutil.copytree(source_vault, temp_dir / "vault")
-            yield temp_dir / "vault"
+            shutil.copytree(source_vault, tmp_path / "vault")
+            return tmp_path / "vault"
         else:
             # If obsidian_vault doesn't exist, create minimal test structure
-            vault_dir = temp_dir / "vault"
+            vault_dir = tmp_path / "vault"
             vault_dir.mkdir()
 
             # Create a test note with tasks
@@ -58,17 +54,13 @@ date: 2025-01-15
 ## Notes
 Some additional content here.
 """)
-            yield vault_dir
-
-        # Cleanup
-        shutil.rmtree(temp_dir)
+            return vault_dir
 
     @pytest.fixture
     async def client(self, temp_vault_path):
         """Create ObsidianClient instance with temporary vault."""
         return ObsidianClient(temp_vault_path, user_id=1)
 
-    @pytest.mark.asyncio
     async def test_parse_tasks_from_real_notes(self, client):
         """Test parsing tasks from real vault notes."""
         # Get all notes
@@ -99,7 +91,6 @@ Some additional content here.
                 assert isinstance(task.line_number, int)
                 assert task.line_number > 0
 
-    @pytest.mark.asyncio
     async def test_get_pending_tasks_from_vault(self, client):
         """Test getting pending tasks from the entire vault."""
         pending_tasks = await client.get_pending_tasks()
@@ -113,7 +104,6 @@ Some additional content here.
             assert isinstance(task.text, str)
             assert len(task.text.strip()) > 0
 
-    @pytest.mark.asyncio
     async def test_task_completion_stats(self, client):
         """Test getting task completion statistics."""
         # Get vault-wide stats
@@ -136,7 +126,6 @@ Some additional content here.
             expected_ratio = vault_stats["completed_tasks"] / vault_stats["total_tasks"]
             assert abs(vault_stats["completion_ratio"] - expected_ratio) < 0.001
 
-    @pytest.mark.asyncio
     async def test_mark_task_complete_integration(self, client):
         """Test marking a task complete in a real note."""
         # Get a note with pending tasks
@@ -173,7 +162,6 @@ Some additional content here.
         assert updated_task is not None
         assert updated_task.completed is True
 
-    @pytest.mark.asyncio
     async def test_mark_task_incomplete_integration(self, client):
         """Test marking a task incomplete in a real note."""
         # Get a note with completed tasks
@@ -210,7 +198,6 @@ Some additional content here.
         assert updated_task is not None
         assert updated_task.completed is False
 
-    @pytest.mark.asyncio
     async def test_error_handling_integration(self, client):
         """Test error handling with real vault operations."""
 
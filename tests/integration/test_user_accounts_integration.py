@@ -19,7 +19,6 @@ async def session_maker(tmp_path):
     await engine.dispose()
 
 
-@pytest.mark.asyncio
 async def test_daily_briefing_account_retrieval(session_maker):
     """Test the complete flow of retrieving accounts for daily briefing."""
     user_service = UserService(session_maker)
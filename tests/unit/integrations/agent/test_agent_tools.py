@@ -1,13 +1,11 @@
 from datetime import UTC, date, datetime
 
-import pytest
-
+from the_assistant.integrations import agent_tools
 from the_assistant.integrations.agent_tools import get_default_tools
 from the_assistant.models.google import CalendarEvent, GmailMessage
 from the_assistant.models.weather import HourlyForecast, WeatherForecast
 
 
-@pytest.mark.asyncio
 async def test_send_message_tool(monkeypatch):
     called = False
 
@@ -23,14 +21,8 @@ async def test_send_message_tool(monkeypatch):
     async def mock_get_mcp_tools():
         return []
 
-    monkeypatch.setattr(
-        "the_assistant.integrations.agent_tools.TelegramClient",
-        DummyClient,
-    )
-    monkeypatch.setattr(
-        "the_assistant.integrations.agent_tools.get_mcp_tools",
-        mock_get_mcp_tools,
-    )
+    monkeypatch.setattr(agent_tools, "TelegramClient", DummyClient)
+    monkeypatch.setattr(agent_tools, "get_mcp_tools", mock_get_mcp_tools)
 
     tools = await get_default_tools(1)
     send_tool = next(t for t in tools if t.name == "send_message")
@@ -38,7 +30,6 @@ async def test_send_message_tool(monkeypatch):
     assert called
 
 
-@pytest.mark.asyncio
 async def test_get_event_tool(monkeypatch):
     dt = datetime.now(UTC)
     event = CalendarEvent(
@@ -61,14 +52,8 @@ async def test_get_event_tool(monkeypatch):
     async def mock_get_mcp_tools():
         return []
 
-    monkeypatch.setattr(
-        "the_assistant.integrations.agent_tools.GoogleClient",
-        DummyClient,
-    )
-    monkeypatch.setattr(
-        "the_assistant.integrations.agent_tools.get_mcp_tools",
-        mock_get_mcp_tools,
-    )
+    monkeypatch.setattr(agent_tools, "GoogleClient", DummyClient)
+    monkeypatch.setattr(agent_tools, "get_mcp_tools", mock_get_mcp_tools)
 
     tools = await get_default_tools(1)
     tool_obj = next(t for t in tools if t.name == "get_event")
@@ -76,7 +61,6 @@ async def test_get_event_tool(monkeypatch):
     assert result["id"] == "e1"
 
 
-@pytest.mark.asyncio
 async def test_get_email_tool(monkeypatch):
     email = GmailMessage(
         id="m1",
@@ -100,14 +84,8 @@ async def test_get_email_tool(monkeypatch):
     async def mock_get_mcp_tools():
         return []
 
-    monkeypatch.setattr(
-        "the_assistant.integrations.agent_tools.GoogleClient",
-        DummyClient,
-    )
-    monkeypatch.setattr(
-        "the_assistant.integrations.agent_tools.get_mcp_tools",
-        mock_get_mcp_tools,
-    )
+    monkeypatch.setattr(agent_tools, "GoogleClient", DummyClient)
+    monkeypatch.setattr(agent_tools, "get_mcp_tools", mock_get_mcp_tools)
 
     tools = await get_default_tools(1)
     tool_obj = next(t for t in tools if t.name == "get_email")
@@ -115,7 +93,6 @@ async def test_get_email_tool(monkeypatch):
     assert result["id"] == "m1"
 
 
-@pytest.mark.asyncio
 async def test_weather_tool(monkeypatch):
     forecast = WeatherForecast(
         location="Paris",
@@ -147,14 +124,8 @@ async def test_weather_tool(monkeypatch):
     async def mock_get_mcp_tools():
         return []
 
-    monkeypatch.setattr(
-        "the_assistant.integrations.agent_tools.WeatherClient",
-        lambda: DummyClient(),
-    )
-    monkeypatch.setattr(
-        "the_assistant.integrations.agent_tools.get_mcp_tools",
-        mock_get_mcp_tools,
-    )
+    monkeypatch.setattr(agent_tools, "WeatherClient", lambda: DummyClient())
+    monkeypatch.setattr(agent_tools, "get_mcp_tools", mock_get_mcp_tools)
 
     tools = await get_default_tools(1)
     tool_obj = next(t for t in tools if t.name == "weather")
@@ -4,7 +4,7 @@ import base64
 import json
 from datetime import UTC, datetime
 from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock, mock_open, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from google.oauth2.credentials import Credentials
@@ -86,19 +86,6 @@ class TestGoogleClient:
         creds.refresh.return_value = None
         return creds
 
-    @pytest.fixture
-    def sample_credentials_json(self):
-        """Sample credentials JSON content."""
-        return {
-            "installed": {
-                "client_id": "test_client_id",
-                "client_secret": "test_client_secret",
-                "auth_uri": "https://accounts.google.com/o/oauth2/auth",
-                "token_uri": "https://oauth2.googleapis.com/token",
-                "redirect_uris": ["http://localhost:8080/google/oauth2callback"],
-            }
-        }
-
     def test_init(self):
         """Test initialization of GoogleClient."""
         client = GoogleClient(user_id=1)
@@ -160,13 +147,10 @@ class TestGoogleClient:
         result = await client.is_authenticated()
         assert result is False
 
-    @patch("builtins.open", new_callable=mock_open)
     @patch("the_assistant.integrations.google.client.InstalledAppFlow")
-    async def test_generate_auth_url_success(
-        self, mock_flow_class, mock_file, sample_credentials_json
-    ):
+    async def test_generate_auth_url_success(self, mock_flow_class):
         """Test successful authorization URL generation."""
-        mock_file.return_value.read.return_value = json.dumps(sample_credentials_json)
+        # The flow is mocked, so the client secrets file is never opened.
         mock_flow = MagicMock()
         mock_flow.authorization_url.return_value = ("https://auth.url", "state")
         mock_flow_class.from_client_secrets_file.return_value = mock_flow
@@ -3,8 +3,6 @@ import os
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, patch
 
-import pytest
-
 import the_assistant.integrations.google.oauth_router as oauth_router
 
 
@@ -14,7 +12,6 @@ def test_missing_jwt_secret_no_error():
         importlib.reload(oauth_router)
 
 
-@pytest.mark.asyncio
 async def test_oauth_callback_sends_notification():
     """OAuth callback notifies the user via Telegram."""
 
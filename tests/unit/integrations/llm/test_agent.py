@@ -1,12 +1,11 @@
-import pytest
 from langchain.callbacks.base import BaseCallbackHandler
 from langchain_core.language_models.fake_chat_models import FakeChatModel
 from langchain_core.messages import AIMessage
 
 from the_assistant.integrations.llm import LLMAgent, Task
+from the_assistant.integrations.llm import agent as llm_agent
 
 
-@pytest.mark.asyncio
 async def test_llm_agent_runs(monkeypatch):
     # Mock the create_react_agent function to avoid bind_tools issues
     class MockAgentExecutor:
@@ -16,18 +15,12 @@ async def test_llm_agent_runs(monkeypatch):
     def mock_create_react_agent(model, tools, prompt):
         return MockAgentExecutor()
 
-    monkeypatch.setattr(
-        "the_assistant.integrations.llm.agent.create_react_agent",
-        mock_create_react_agent,
-    )
+    monkeypatch.setattr(llm_agent, "create_react_agent", mock_create_react_agent)
 
     async def mock_get_default_tools(user_id):
         return []
 
-    monkeypatch.setattr(
-        "the_assistant.integrations.llm.agent.get_default_tools",
-        mock_get_default_tools,
-    )
+    monkeypatch.setattr(llm_agent, "get_default_tools", mock_get_default_tools)
 
     llm = FakeChatModel()
     agent = LLMAgent(system_prompt="sys", model=llm)
@@ -36,7 +29,6 @@ async def test_llm_agent_runs(monkeypatch):
     assert "Hello World" in result
 
 
-@pytest.mark.asyncio
 async def test_llm_agent_langsmith(monkeypatch):
     tracer_called = False
 
@@ -54,23 +46,14 @@ async def test_llm_agent_langsmith(monkeypatch):
     def mock_create_react_agent(model, tools, prompt):
         return MockAgentExecutor()
 
-    monkeypatch.setattr(
-        "the_assistant.integrations.llm.agent.create_react_agent",
-        mock_create_react_agent,
-    )
+    monkeypatch.setattr(llm_agent, "create_react_agent", mock_create_react_agent)
 
     async def mock_get_default_tools(user_id):
         return []
 
-    monkeypatch.setattr(
-        "the_assistant.integrations.llm.agent.get_default_tools",
-        mock_get_default_tools,
-    )
+    monkeypatch.setattr(llm_agent, "get_default_tools", mock_get_default_tools)
 
-    monkeypatch.setattr(
-        "the_assistant.integrations.llm.agent.LangChainTracer",
-        DummyTracer,
-    )
+    monkeypatch.setattr(llm_agent, "LangChainTracer", DummyTracer)
 
     llm = FakeChatModel()
     agent = LLMAgent(system_prompt="sys", model=llm, langsmith_project="proj")
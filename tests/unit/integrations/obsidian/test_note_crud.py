@@ -6,7 +6,6 @@ using the example vault notes as test data.
 """
 
 import shutil
-import tempfile
 from datetime import date
 from pathlib import Path
 
@@ -24,11 +23,9 @@ class TestObsidianClientCRUD:
     """Test suite for ObsidianClient CRUD operations."""
 
     @pytest.fixture
-    def temp_vault_path(self):
+    def temp_vault_path(self, tmp_path):
         """Create a temporary vault directory for testing."""
-        temp_dir = tempfile.mkdtemp()
-        yield Path(temp_dir)
-        shutil.rmtree(temp_dir)
+        return tmp_path
 
     @pytest.fixture
     def example_vault_path(self):
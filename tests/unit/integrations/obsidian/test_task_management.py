@@ -117,7 +117,6 @@ start_date: 2025-03-15
             links=[],
         )
 
-    @pytest.mark.asyncio
     async def test_mark_task_complete(self, client, sample_note_with_tasks):
         """Test marking a task as complete."""
         # Mock the get_note method
@@ -131,7 +130,6 @@ start_date: 2025-03-15
         assert result is True
         client.vault_manager.save_note.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_mark_task_incomplete(self, client, sample_note_with_tasks):
         """Test marking a task as incomplete."""
         # Mock the get_note method
@@ -147,7 +145,6 @@ start_date: 2025-03-15
         assert result is True
         client.vault_manager.save_note.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_update_task_status_not_found(self, client, sample_note_with_tasks):
         """Test updating a task that doesn't exist."""
         client.get_note = AsyncMock(return_value=sample_note_with_tasks)
@@ -155,7 +152,6 @@ start_date: 2025-03-15
         with pytest.raises(TaskUpdateError, match="Task not found"):
             await client.update_task_status("test.md", "Nonexistent task", True)
 
-    @pytest.mark.asyncio
     async def test_update_task_status_note_not_found(self, client):
         """Test updating a task in a note that doesn't exist."""
         client.get_note = AsyncMock(return_value=None)
@@ -163,7 +159,6 @@ start_date: 2025-03-15
         with pytest.raises(NoteNotFoundError, match="Note not found"):
             await client.update_task_status("nonexistent.md", "Some task", True)
 
-    @pytest.mark.asyncio
     async def test_get_task_by_line_number(self, client, sample_note_with_tasks):
         """Test retrieving a task by its line number."""
         client.get_note = AsyncMock(return_value=sample_note_with_tasks)
@@ -175,7 +170,6 @@ start_date: 2025-03-15
         assert task.line_number == 10
         assert not task.completed
 
-    @pytest.mark.asyncio
     async def test_get_task_by_line_number_not_found(
         self, client, sample_note_with_tasks
     ):
@@ -186,7 +180,6 @@ start_date: 2025-03-15
 
         assert task is None
 
-    @pytest.mark.asyncio
     async def test_get_tasks_under_heading(self, client, sample_note_with_tasks):
         """Test retrieving tasks under a specific heading."""
         client.get_note = AsyncMock(return_value=sample_note_with_tasks)
@@ -196,7 +189,6 @@ start_date: 2025-03-15
         assert len(tasks) == 5  # All tasks are under "Tasks" heading
         assert all(task.parent_heading == "Tasks" for task in tasks)
 
-    @pytest.mark.asyncio
     async def test_get_task_completion_stats(self, client, sample_note_with_tasks):
         """Test getting task completion statistics for a note."""
         client.get_note = AsyncMock(return_value=sample_note_with_tasks)
@@ -45,7 +45,6 @@ class TestVaultManager:
         with pytest.raises(VaultNotFoundError):
             VaultManager("nonexistent_vault")
 
-    @pytest.mark.asyncio
     async def test_scan_vault(self, vault_manager):
         """Test scanning the vault for Markdown files."""
         note_paths = await vault_manager.scan_vault()
@@ -57,7 +56,6 @@ class TestVaultManager:
         for path in note_paths:
             assert path.suffix == ".md"
 
-    @pytest.mark.asyncio
     async def test_load_note_raw(self, vault_manager):
         """Test loading raw content of a note."""
         # Use a known note from the test vault
@@ -69,13 +67,11 @@ class TestVaultManager:
         assert "tags:" in content
         assert "france" in content
 
-    @pytest.mark.asyncio
     async def test_load_nonexistent_note(self, vault_manager):
         """Test loading a note that doesn't exist."""
         with pytest.raises(NoteNotFoundError):
             await vault_manager.load_note_raw("NonexistentNote.md")
 
-    @pytest.mark.asyncio
     async def test_get_note_stats(self, vault_manager):
         """Test getting statistics for a note."""
         # Use a known note from the test vault
@@ -92,7 +88,6 @@ class TestVaultManager:
         assert "filename" in stats
         assert stats["filename"] == "Trip to Paris.md"
 
-    @pytest.mark.asyncio
     async def test_note_exists(self, vault_manager):
         """Test checking if a note exists."""
         # Test with existing note
@@ -101,7 +96,6 @@ class TestVaultManager:
         # Test with nonexistent note
         assert not await vault_manager.note_exists("NonexistentNote.md")
 
-    @pytest.mark.asyncio
     async def test_get_vault_stats(self, vault_manager):
         """Test getting statistics for the entire vault."""
         stats = await vault_manager.get_vault_stats()
@@ -114,7 +108,6 @@ class TestVaultManager:
         assert stats["total_size_bytes"] > 0
         assert "vault_path" in stats
 
-    @pytest.mark.asyncio
     async def test_create_directory(self, vault_manager):
         """Test creating a directory in the vault."""
         test_dir = "test_directory_temp"
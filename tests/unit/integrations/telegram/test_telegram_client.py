@@ -2,13 +2,13 @@
 
 from datetime import UTC, datetime
 from types import SimpleNamespace
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
-from telegram import Bot, Chat, Message, Update, User
 from telegram.constants import ParseMode
-from telegram.error import NetworkError, TelegramError
+from telegram.error import BadRequest, Forbidden, NetworkError, TelegramError
 
+from the_assistant.integrations import llm
 from the_assistant.integrations.telegram.constants import SettingKey
 from the_assistant.integrations.telegram.telegram_client import (
     TelegramClient,
@@ -24,89 +24,225 @@ from the_assistant.integrations.telegram.telegram_client import (
     start_update_settings,
 )
 
+TELEGRAM_CLIENT_MODULE = "the_assistant.integrations.telegram.telegram_client"
+
+REGISTERED_USER = SimpleNamespace(id=1, telegram_chat_id=123)
+
+# Reply sent to users who run a command before /start
+REGISTER_FIRST = "need to register first"
+
+SETTINGS = SimpleNamespace(
+    telegram_token="test_token",
+    jwt_secret="test-secret",
+    temporal_host="localhost:7233",
+    temporal_namespace="default",
+    temporal_task_queue="the-assistant",
+)
+
+USER_SERVICE_METHODS = (
+    "create_countdown",
+    "create_task",
+    "create_user",
+    "get_setting",
+    "get_user_by_id",
+    "get_user_by_telegram_chat_id",
+    "set_setting",
+    "update_user",
+)
+
+
+FROZEN_NOW = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+class _BotSpec:
+    """The subset of ``telegram.Bot`` that ``TelegramClient`` uses."""
+
+    async def get_me(self): ...
+
+    async def send_message(self, *args, **kwargs): ...
+
+    async def set_my_commands(self, *args, **kwargs): ...
+
+
+def replies(message) -> list[str]:
+    """Return the texts passed to ``message.reply_text`` in call order."""
+    return [c.args[0] for c in message.reply_text.call_args_list]
+
+
+class FakeUserService:
+    """Minimal user service that serves one user to ``TelegramClient``."""
+
+    def __init__(self, user):
+        self._user = user
+        self.requested_ids: list[int] = []
+
+    async def get_user_by_id(self, user_id: int):
+        self.requested_ids.append(user_id)
+        return self._user
+
+
+async def noop_handler(update, context) -> None:
+    """Command handler for tests that register handlers but never call them."""
+
+
+def make_user_service() -> AsyncMock:
+    """Build a user service stub with the methods the handlers call."""
+    service = AsyncMock()
+    service.configure_mock(**{name: AsyncMock() for name in USER_SERVICE_METHODS})
+    return service
+
+
+@pytest.fixture(scope="module", autouse=True)
+def patched_services(frozen_datetime):
+    """Replace the collaborators of the command handlers once per module."""
+    with pytest.MonkeyPatch.context() as mp:
+        services = SimpleNamespace(
+            get_user_service=MagicMock(),
+            user_service=make_user_service(),
+            get_settings=MagicMock(return_value=SETTINGS),
+            GoogleClient=MagicMock(),
+            TaskParser=MagicMock(),
+            CountdownParser=MagicMock(),
+            Client=MagicMock(),
+            create_state_jwt=MagicMock(return_value="state"),
+        )
+        mp.setattr(
+            f"{TELEGRAM_CLIENT_MODULE}.get_user_service",
+            services.get_user_service,
+        )
+        mp.setattr(f"{TELEGRAM_CLIENT_MODULE}.get_settings", services.get_settings)
+        mp.setattr(f"{TELEGRAM_CLIENT_MODULE}.GoogleClient", services.GoogleClient)
+        mp.setattr(f"{TELEGRAM_CLIENT_MODULE}.Client", services.Client)
+        mp.setattr(
+            f"{TELEGRAM_CLIENT_MODULE}.create_state_jwt", services.create_state_jwt
+        )
+        mp.setattr(f"{TELEGRAM_CLIENT_MODULE}.datetime", frozen_datetime(FROZEN_NOW))
+        # The parsers are imported lazily from the llm package by the handlers.
+        mp.setattr(llm, "TaskParser", services.TaskParser)
+        mp.setattr(llm, "CountdownParser", services.CountdownParser)
+        yield services
+
+
+@pytest.fixture(autouse=True)
+def _fresh_services(patched_services):
+    """Give every test fresh objects from the module-wide stubs."""
+    for factory in vars(patched_services).values():
+        factory.reset_mock()
+    # Reuse the pre-wired user service, dropping whatever the last test set up.
+    patched_services.user_service.reset_mock(return_value=True, side_effect=True)
+    patched_services.get_user_service.return_value = patched_services.user_service
+    patched_services.GoogleClient.return_value = AsyncMock()
+    patched_services.GoogleClient.return_value.generate_auth_url.return_value = (
+        "http://auth"
+    )
+    patched_services.TaskParser.return_value = AsyncMock()
+    patched_services.CountdownParser.return_value = AsyncMock()
+    patched_services.Client.connect = AsyncMock(return_value=AsyncMock())
+
+
+@pytest.fixture
+def user_service(patched_services):
+    """User service returned by the patched ``get_user_service``."""
+    return patched_services.user_service
+
+
+@pytest.fixture
+def fake_user_service(patched_services):
+    """Serve a registered user through a plain fake instead of the stub."""
+    service = FakeUserService(REGISTERED_USER)
+    patched_services.get_user_service.return_value = service
+    return service
+
+
+@pytest.fixture
+def settings(patched_services):
+    """Settings returned by the patched ``get_settings``."""
+    return SETTINGS
+
+
+@pytest.fixture
+def google_client(patched_services):
+    """Google client instance built by the patched ``GoogleClient``."""
+    return patched_services.GoogleClient.return_value
+
+
+@pytest.fixture
+def task_parser(patched_services):
+    """Parser instance built by the patched ``TaskParser``."""
+    return patched_services.TaskParser.return_value
+
+
+@pytest.fixture
+def countdown_parser(patched_services):
+    """Parser instance built by the patched ``CountdownParser``."""
+    return patched_services.CountdownParser.return_value
+
+
+@pytest.fixture
+def temporal_client(patched_services):
+    """Temporal client returned by the patched ``Client.connect``."""
+    return patched_services.Client.connect.return_value
+
 
 @pytest.fixture
 def mock_bot():
     """Create a mock Telegram Bot."""
-    mock = AsyncMock(spec=Bot)
-    mock.get_me = AsyncMock(return_value=MagicMock(username="test_bot"))
-    mock.send_message = AsyncMock(return_value=True)
+    mock = AsyncMock(spec_set=_BotSpec)
+    mock.get_me.return_value = SimpleNamespace(username="test_bot")
+    mock.send_message.return_value = True
     return mock
 
 
 @pytest.fixture
 def telegram_client(mock_bot):
     """Create a TelegramClient with a mock bot."""
-    with (
-        patch(
-            "the_assistant.integrations.telegram.telegram_client.Bot",
-            return_value=mock_bot,
-        ),
-        patch(
-            "the_assistant.integrations.telegram.telegram_client.get_settings",
-            return_value=SimpleNamespace(telegram_token="test_token"),
-        ),
-    ):
-        client = TelegramClient(user_id=1)
-        client.bot = mock_bot
-        return client
+    client = TelegramClient(user_id=1)
+    client.bot = mock_bot
+    return client
+
+
+def make_update(text: str = "/test", chat_id: int = 123) -> SimpleNamespace:
+    """Build a fake Telegram Update with an awaitable ``message.reply_text``."""
+    return SimpleNamespace(
+        effective_user=SimpleNamespace(id=chat_id, first_name="Test"),
+        effective_chat=SimpleNamespace(id=chat_id),
+        message=SimpleNamespace(text=text, reply_text=AsyncMock()),
+    )
 
 
 @pytest.fixture
 def mock_update():
     """Create a mock Telegram Update object."""
-    user = MagicMock(spec=User)
-    user.id = 123
-    user.first_name = "Test"
-
-    chat = MagicMock(spec=Chat)
-    chat.id = 123
-
-    message = MagicMock(spec=Message)
-    message.text = "/test"
-    message.reply_text = AsyncMock()
-
-    update = MagicMock(spec=Update)
-    update.effective_user = user
-    update.effective_chat = chat
-    update.message = message
-
-    return update
+    return make_update()
 
 
 @pytest.fixture
 def mock_context():
     """Create a mock context for command handlers."""
-    return MagicMock()
+    context = MagicMock()
+    context.args = []
+    context.user_data = {}
+    return context
 
 
 class TestTelegramClient:
     """Tests for the TelegramClient class."""
 
-    def test_init(self):
+    def test_init(self, settings, monkeypatch):
         """Test initialization of the TelegramClient."""
-        with patch(
-            "the_assistant.integrations.telegram.telegram_client.get_settings",
-            return_value=SimpleNamespace(telegram_token="test_token"),
-        ):
-            client = TelegramClient(user_id=1)
-            assert client.token == "test_token"
-
-        with patch(
-            "the_assistant.integrations.telegram.telegram_client.get_settings",
-            return_value=SimpleNamespace(telegram_token=""),
-        ):
-            with pytest.raises(ValueError):
-                TelegramClient(user_id=1)
-
-    @pytest.mark.asyncio
+        client = TelegramClient(user_id=1)
+        assert client.token == "test_token"
+
+        monkeypatch.setattr(settings, "telegram_token", "")
+        with pytest.raises(ValueError):
+            TelegramClient(user_id=1)
+
     async def test_validate_credentials_success(self, telegram_client):
         """Test successful credential validation."""
         result = await telegram_client.validate_credentials()
         assert result is True
         telegram_client.bot.get_me.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_validate_credentials_failure(self, telegram_client):
         """Test failed credential validation."""
         telegram_client.bot.get_me.side_effect = TelegramError("Invalid token")
@@ -114,616 +250,379 @@ class TestTelegramClient:
         assert result is False
         telegram_client.bot.get_me.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_send_message_success(self, telegram_client):
+    async def test_send_message_success(self, telegram_client, fake_user_service):
         """Test successful message sending."""
-        # Mock user service to return a user with telegram_chat_id
-        mock_user = SimpleNamespace(telegram_chat_id=123)
-        with patch(
-            "the_assistant.integrations.telegram.telegram_client.get_user_service"
-        ) as mock_get_service:
-            mock_service = AsyncMock()
-            mock_service.get_user_by_id.return_value = mock_user
-            mock_get_service.return_value = mock_service
-
-            result = await telegram_client.send_message("Test message")
-
-            assert result is True
-            mock_service.get_user_by_id.assert_called_once_with(
-                1
-            )  # user_id from fixture
-            telegram_client.bot.send_message.assert_called_once_with(
-                chat_id=123, text="Test message", parse_mode=ParseMode.HTML
-            )
+        result = await telegram_client.send_message("Test message")
 
-    @pytest.mark.asyncio
-    async def test_send_message_error_propagates(self, telegram_client):
-        """Send message raises when the Telegram API fails."""
-        mock_user = SimpleNamespace(telegram_chat_id=123)
+        assert result is True
+        assert fake_user_service.requested_ids == [1]
+        send_message = telegram_client.bot.send_message
+        assert send_message.call_count == 1
+        assert send_message.call_args.kwargs == {
+            "chat_id": 123,
+            "text": "Test message",
+            "parse_mode": ParseMode.HTML,
+        }
 
-        telegram_client.bot.send_message.side_effect = NetworkError("Network error")
-        with patch(
-            "the_assistant.integrations.telegram.telegram_client.get_user_service"
-        ) as mock_get_service:
-            mock_service = AsyncMock()
-            mock_service.get_user_by_id.return_value = mock_user
-            mock_get_service.return_value = mock_service
+    @pytest.mark.parametrize(
+        "error",
+        [
+            NetworkError("Network error"),
+            BadRequest("Chat not found"),
+            Forbidden("Bot was blocked by the user"),
+            RuntimeError("Unexpected failure"),
+        ],
+        ids=["network", "bad_request", "forbidden", "other"],
+    )
+    async def test_send_message_error_propagates(
+        self, telegram_client, fake_user_service, error
+    ):
+        """Send message re-raises whatever the Telegram API fails with."""
+        telegram_client.bot.send_message.side_effect = error
 
-            with pytest.raises(NetworkError):
-                await telegram_client.send_message("Test message")
-            telegram_client.bot.send_message.assert_called_once()
+        with pytest.raises(type(error)):
+            await telegram_client.send_message("Test message")
+        telegram_client.bot.send_message.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_register_command_handler(self, telegram_client):
         """Test command handler registration."""
-        handler = AsyncMock()
-        await telegram_client.register_command_handler("test", handler)
+        await telegram_client.register_command_handler("test", noop_handler)
         assert "test" in telegram_client._command_handlers
-        assert telegram_client._command_handlers["test"] == handler
+        assert telegram_client._command_handlers["test"] is noop_handler
 
-    @pytest.mark.asyncio
     async def test_handle_unknown_command(
         self, telegram_client, mock_update, mock_context
     ):
         """Test handling of unknown commands."""
         telegram_client._command_handlers = {
-            "start": AsyncMock(),
-            "help": AsyncMock(),
+            "start": noop_handler,
+            "help": noop_handler,
         }
         await telegram_client._handle_unknown_command(mock_update, mock_context)
         mock_update.message.reply_text.assert_called_once()
         assert "Available commands" in mock_update.message.reply_text.call_args[0][0]
 
-    @pytest.mark.asyncio
-    async def test_setup_command_handlers(self, telegram_client):
+    async def test_setup_command_handlers(self, telegram_client, monkeypatch):
         """Test setting up command handlers."""
-        with patch(
-            "the_assistant.integrations.telegram.telegram_client.ApplicationBuilder"
-        ) as mock_builder:
-            mock_app = MagicMock()
-            mock_builder.return_value.token.return_value.build.return_value = mock_app
-
-            # Register some command handlers
-            handler1 = AsyncMock()
-            handler2 = AsyncMock()
-            await telegram_client.register_command_handler("start", handler1)
-            await telegram_client.register_command_handler("help", handler2)
-
-            # Setup command handlers
-            await telegram_client.setup_command_handlers()
-
-            # Verify application was created
-            mock_builder.assert_called_once()
-            mock_builder.return_value.token.assert_called_once_with("test_token")
-
-            # Verify handlers were added (2 test commands + unknown handler + conversation handlers)
-            assert (
-                mock_app.add_handler.call_count >= 3
-            )  # At least 2 commands + 1 unknown command handler
-
-            # Verify application was stored
-            assert telegram_client.application == mock_app
-
-            # Test calling setup again (should not recreate application)
-            await telegram_client.setup_command_handlers()
-            mock_builder.assert_called_once()  # Still only called once
-
-    @pytest.mark.asyncio
-    async def test_handle_google_auth_command_send_link(
-        self, mock_update, mock_context
-    ):
-        """Ensure auth link is sent when user is not authenticated."""
+        mock_app = MagicMock()
+        builders = []
+        tokens = []
 
-        user = SimpleNamespace(id=1, telegram_chat_id=123)
-        user_service = AsyncMock()
-        user_service.get_user_by_telegram_chat_id = AsyncMock(return_value=user)
+        def token(value):
+            tokens.append(value)
+            return SimpleNamespace(build=lambda: mock_app)
 
-        google_client = AsyncMock()
-        google_client.is_authenticated = AsyncMock(return_value=False)
-        google_client.generate_auth_url = AsyncMock(return_value="http://auth")
+        def application_builder():
+            builders.append(SimpleNamespace(token=token))
+            return builders[-1]
 
-        with (
-            patch(
-                "the_assistant.integrations.telegram.telegram_client.get_user_service",
-                return_value=user_service,
-            ),
-            patch(
-                "the_assistant.integrations.telegram.telegram_client.GoogleClient",
-                return_value=google_client,
-            ) as mock_client,
-            patch(
-                "the_assistant.integrations.telegram.telegram_client.create_state_jwt",
-                return_value="state",
-            ) as mock_state,
-            patch(
-                "the_assistant.integrations.telegram.telegram_client.get_settings",
-                return_value=SimpleNamespace(jwt_secret="test-secret"),
-            ) as mock_settings,
-        ):
-            mock_context.args = ["personal"]
-            await handle_google_auth_command(mock_update, mock_context)
-
-        mock_client.assert_called_once_with(user.id, account="personal")
-        mock_state.assert_called_once_with(
-            user.id, mock_settings.return_value, account="personal"
+        monkeypatch.setattr(
+            f"{TELEGRAM_CLIENT_MODULE}.ApplicationBuilder", application_builder
         )
 
-        google_client.generate_auth_url.assert_awaited_once_with("state")
-        assert mock_update.message.reply_text.called
-        assert "http://auth" in mock_update.message.reply_text.call_args[0][0]
+        # Register some command handlers
+        await telegram_client.register_command_handlers(
+            {"start": noop_handler, "help": noop_handler}
+        )
 
-    @pytest.mark.asyncio
-    async def test_handle_google_auth_command_already_authenticated(
-        self, mock_update, mock_context
+        # Setup command handlers
+        await telegram_client.setup_command_handlers()
+
+        # Verify application was created
+        assert len(builders) == 1
+        assert tokens == ["test_token"]
+
+        # Verify handlers were added (2 test commands + unknown handler + conversation handlers)
+        assert (
+            mock_app.add_handler.call_count >= 3
+        )  # At least 2 commands + 1 unknown command handler
+
+        # Verify application was stored
+        assert telegram_client.application == mock_app
+
+        # Test calling setup again (should not recreate application)
+        await telegram_client.setup_command_handlers()
+        assert len(builders) == 1  # Still only called once
+
+    @pytest.mark.parametrize(
+        "account,is_authenticated,expected_reply",
+        [
+            ("personal", False, "http://auth"),
+            ("work", True, "already"),
+        ],
+        ids=["send_link", "already_authenticated"],
+    )
+    async def test_handle_google_auth_command(
+        self,
+        mock_update,
+        mock_context,
+        patched_services,
+        user_service,
+        settings,
+        google_client,
+        account,
+        is_authenticated,
+        expected_reply,
     ):
-        """A message is shown if the user is already authenticated."""
-
-        user = SimpleNamespace(id=1, telegram_chat_id=123)
-        user_service = AsyncMock()
-        user_service.get_user_by_telegram_chat_id = AsyncMock(return_value=user)
+        """An auth link is sent unless the account is already authenticated."""
+        user_service.get_user_by_telegram_chat_id.return_value = REGISTERED_USER
+        google_client.is_authenticated.return_value = is_authenticated
 
-        google_client = AsyncMock()
-        google_client.is_authenticated = AsyncMock(return_value=True)
-
-        with (
-            patch(
-                "the_assistant.integrations.telegram.telegram_client.get_user_service",
-                return_value=user_service,
-            ),
-            patch(
-                "the_assistant.integrations.telegram.telegram_client.GoogleClient",
-                return_value=google_client,
-            ) as mock_client,
-        ):
-            mock_context.args = ["work"]
-            await handle_google_auth_command(mock_update, mock_context)
-
-        mock_client.assert_called_once_with(user.id, account="work")
+        mock_context.args = [account]
+        await handle_google_auth_command(mock_update, mock_context)
 
+        patched_services.GoogleClient.assert_called_once_with(
+            REGISTERED_USER.id, account=account
+        )
         google_client.is_authenticated.assert_awaited_once()
-        assert mock_update.message.reply_text.called
-        assert "already" in mock_update.message.reply_text.call_args[0][0].lower()
-
-    @pytest.mark.asyncio
-    async def test_handle_google_auth_command_unregistered_user(
-        self, mock_update, mock_context
+        if is_authenticated:
+            patched_services.create_state_jwt.assert_not_called()
+            google_client.generate_auth_url.assert_not_called()
+        else:
+            patched_services.create_state_jwt.assert_called_once_with(
+                REGISTERED_USER.id, settings, account=account
+            )
+            google_client.generate_auth_url.assert_awaited_once_with("state")
+
+        (reply,) = replies(mock_update.message)
+        assert expected_reply in reply.lower()
+
+    @pytest.mark.parametrize(
+        "connect_error,expected_reply",
+        [
+            (None, "being generated and will be delivered"),
+            (Exception("Connection failed"), "encountered an error"),
+        ],
+        ids=["success", "temporal_error"],
+    )
+    async def test_handle_briefing_command(
+        self,
+        mock_update,
+        mock_context,
+        patched_services,
+        user_service,
+        temporal_client,
+        monkeypatch,
+        connect_error,
+        expected_reply,
     ):
-        """A helpful message is sent if the user is not registered."""
-
-        user_service = AsyncMock()
-        user_service.get_user_by_telegram_chat_id = AsyncMock(return_value=None)
-
-        with patch(
-            "the_assistant.integrations.telegram.telegram_client.get_user_service",
-            return_value=user_service,
-        ):
-            mock_context.args = []
-            await handle_google_auth_command(mock_update, mock_context)
-
-            # Verify that a helpful message was sent instead of raising an error
-            mock_update.message.reply_text.assert_called_once()
-            call_args = mock_update.message.reply_text.call_args[0][0]
-            assert "need to register first" in call_args
-            assert "/start" in call_args
-
-    @pytest.mark.asyncio
-    async def test_handle_briefing_command_success(self, mock_update, mock_context):
-        """Test successful briefing command execution."""
-        user = SimpleNamespace(id=1, telegram_chat_id=123)
-        user_service = AsyncMock()
-        user_service.get_user_by_telegram_chat_id = AsyncMock(return_value=user)
-
-        # Mock Temporal client
-        mock_client = AsyncMock()
-        mock_handle = AsyncMock()
-        mock_handle.id = "briefing-1-123456789"
-        mock_client.start_workflow = AsyncMock(return_value=mock_handle)
-
-        settings = SimpleNamespace(
-            temporal_host="localhost:7233",
-            temporal_namespace="default",
-            temporal_task_queue="the-assistant",
+        """The briefing command replies according to how the workflow start went."""
+        user_service.get_user_by_telegram_chat_id.return_value = REGISTERED_USER
+        patched_services.Client.connect.side_effect = connect_error
+
+        temporal_client.start_workflow.return_value = SimpleNamespace(
+            id="briefing-1-123456789"
         )
 
-        with (
-            patch(
-                "the_assistant.integrations.telegram.telegram_client.get_user_service",
-                return_value=user_service,
-            ),
-            patch(
-                "the_assistant.integrations.telegram.telegram_client.get_settings",
-                return_value=settings,
+        monkeypatch.setattr("time.time", lambda: 123456789)
+        await handle_briefing_command(mock_update, mock_context)
+
+        lookup = user_service.get_user_by_telegram_chat_id
+        assert lookup.call_count == 1
+        assert lookup.call_args.args == (123,)
+
+        if connect_error is None:
+            temporal_client.start_workflow.assert_called_once()
+            args, kwargs = temporal_client.start_workflow.call_args
+            assert kwargs["id"] == "briefing-1-123456789"
+            assert kwargs["task_queue"] == "the-assistant"
+            assert args[1] == 1  # REGISTERED_USER.id
+        else:
+            temporal_client.start_workflow.assert_not_called()
+
+        progress, outcome = replies(mock_update.message)
+        assert "Generating your briefing" in progress
+        assert expected_reply in outcome
+
+    @pytest.mark.parametrize(
+        "handler,args,expected_replies",
+        [
+            (handle_google_auth_command, [], [REGISTER_FIRST]),
+            (
+                handle_briefing_command,
+                None,
+                ["Generating your briefing", REGISTER_FIRST],
             ),
-            patch(
-                "temporalio.client.Client.connect",
-                AsyncMock(return_value=mock_client),
-            ),
-            patch("time.time", return_value=123456789),
-        ):
-            await handle_briefing_command(mock_update, mock_context)
-
-        # Verify user lookup
-        user_service.get_user_by_telegram_chat_id.assert_called_once_with(123)
-
-        # Verify workflow was started
-        mock_client.start_workflow.assert_called_once()
-        args, kwargs = mock_client.start_workflow.call_args
-        assert kwargs["id"] == "briefing-1-123456789"
-        assert kwargs["task_queue"] == "the-assistant"
-        assert args[1] == 1  # user.id
-
-        # Verify messages were sent
-        assert mock_update.message.reply_text.call_count == 2
-        calls = mock_update.message.reply_text.call_args_list
-        assert "Generating your briefing" in calls[0][0][0]
-        assert "being generated and will be delivered" in calls[1][0][0]
-
-    @pytest.mark.asyncio
-    async def test_handle_briefing_command_unregistered_user(
-        self, mock_update, mock_context
-    ):
-        """Test briefing command with unregistered user."""
-        user_service = AsyncMock()
-        user_service.get_user_by_telegram_chat_id = AsyncMock(return_value=None)
-
-        with patch(
-            "the_assistant.integrations.telegram.telegram_client.get_user_service",
-            return_value=user_service,
-        ):
-            await handle_briefing_command(mock_update, mock_context)
-
-        # Verify user lookup
-        user_service.get_user_by_telegram_chat_id.assert_called_once_with(123)
-
-        # Verify error message was sent
-        assert mock_update.message.reply_text.call_count == 2
-        calls = mock_update.message.reply_text.call_args_list
-        assert "Generating your briefing" in calls[0][0][0]
-        assert "need to register first" in calls[1][0][0]
-
-    @pytest.mark.asyncio
-    async def test_handle_briefing_command_temporal_error(
-        self, mock_update, mock_context
+            (handle_add_task_command, ["do", "something"], [REGISTER_FIRST]),
+            (handle_add_countdown_command, ["party"], [REGISTER_FIRST]),
+        ],
+        ids=["google_auth", "briefing", "add_task", "add_countdown"],
+    )
+    async def test_handle_command_unregistered_user(
+        self, mock_update, mock_context, user_service, handler, args, expected_replies
     ):
-        """Test briefing command with Temporal connection error."""
-        user = SimpleNamespace(id=1, telegram_chat_id=123)
-        user_service = AsyncMock()
-        user_service.get_user_by_telegram_chat_id = AsyncMock(return_value=user)
-
-        settings = SimpleNamespace(
-            temporal_host="localhost:7233",
-            temporal_namespace="default",
-            temporal_task_queue="the-assistant",
-        )
+        """Commands point unregistered users at /start instead of failing."""
+        user_service.get_user_by_telegram_chat_id.return_value = None
 
-        with (
-            patch(
-                "the_assistant.integrations.telegram.telegram_client.get_user_service",
-                return_value=user_service,
-            ),
-            patch(
-                "the_assistant.integrations.telegram.telegram_client.get_settings",
-                return_value=settings,
-            ),
-            patch(
-                "temporalio.client.Client.connect",
-                AsyncMock(side_effect=Exception("Connection failed")),
-            ),
-        ):
-            await handle_briefing_command(mock_update, mock_context)
+        mock_context.args = args
+        await handler(mock_update, mock_context)
 
-        # Verify error message was sent
-        assert mock_update.message.reply_text.call_count == 2
-        calls = mock_update.message.reply_text.call_args_list
-        assert "Generating your briefing" in calls[0][0][0]
-        assert "encountered an error" in calls[1][0][0]
+        lookup = user_service.get_user_by_telegram_chat_id
+        assert lookup.call_count == 1
+        assert lookup.call_args.args == (123,)
+        sent = replies(mock_update.message)
+        assert len(sent) == len(expected_replies)
+        for reply, expected in zip(sent, expected_replies, strict=True):
+            assert expected in reply
+        assert "/start" in sent[-1]
 
 
 class TestUpdateSettings:
     """Tests for the settings update conversation."""
 
-    @pytest.mark.asyncio
     async def test_start_update_settings(self, mock_update, mock_context):
         await start_update_settings(mock_update, mock_context)
         mock_update.message.reply_text.assert_called_once()
         args, _ = mock_update.message.reply_text.call_args
         assert "choose which setting" in args[0]
 
-    @pytest.mark.asyncio
-    async def test_save_setting_trim_and_default(self, mock_update, mock_context):
-        user = SimpleNamespace(id=1, telegram_chat_id=123)
-        user_service = AsyncMock()
-        user_service.get_user_by_telegram_chat_id = AsyncMock(return_value=user)
-
-        with patch(
-            "the_assistant.integrations.telegram.telegram_client.get_user_service",
-            return_value=user_service,
-        ):
-            mock_context.user_data = {
-                "setting_key": SettingKey.GREET,
-                "setting_label": "How to greet",
-            }
-            mock_update.message.text = "  Hello  "
-            await save_setting(mock_update, mock_context)
-
-        user_service.set_setting.assert_awaited_once_with(1, SettingKey.GREET, "Hello")
-        assert mock_update.message.reply_text.called
+    @pytest.mark.parametrize(
+        "text,expected",
+        [("  Hello  ", "Hello"), ("", "first_name")],
+        ids=["trimmed", "empty_uses_default"],
+    )
+    async def test_save_setting(self, mock_context, user_service, text, expected):
+        user_service.get_user_by_telegram_chat_id.return_value = REGISTERED_USER
+
+        mock_context.user_data = {
+            "setting_key": SettingKey.GREET,
+            "setting_label": "How to greet",
+        }
+        update = make_update(text)
+        await save_setting(update, mock_context)
 
-    @pytest.mark.asyncio
-    async def test_save_setting_empty_default(self, mock_update, mock_context):
-        user = SimpleNamespace(id=1, telegram_chat_id=123)
-        user_service = AsyncMock()
-        user_service.get_user_by_telegram_chat_id = AsyncMock(return_value=user)
-
-        with patch(
-            "the_assistant.integrations.telegram.telegram_client.get_user_service",
-            return_value=user_service,
-        ):
-            mock_context.user_data = {
-                "setting_key": SettingKey.GREET,
-                "setting_label": "How to greet",
-            }
-            mock_update.message.text = ""
-            await save_setting(mock_update, mock_context)
+        user_service.set_setting.assert_awaited_once_with(1, SettingKey.GREET, expected)
+        assert update.message.reply_text.called
 
-        user_service.set_setting.assert_awaited_once_with(
-            1, SettingKey.GREET, "first_name"
-        )
+    async def test_save_setting_user_not_registered(self, mock_context, user_service):
+        user_service.get_user_by_telegram_chat_id.return_value = None
+
+        mock_context.user_data = {
+            "setting_key": SettingKey.GREET,
+            "setting_label": "How to greet",
+        }
+        with pytest.raises(ValueError):
+            await save_setting(make_update("Hi"), mock_context)
 
-    @pytest.mark.asyncio
-    async def test_save_setting_user_not_registered(self, mock_update, mock_context):
-        user_service = AsyncMock()
-        user_service.get_user_by_telegram_chat_id = AsyncMock(return_value=None)
-
-        with patch(
-            "the_assistant.integrations.telegram.telegram_client.get_user_service",
-            return_value=user_service,
-        ):
-            mock_context.user_data = {
-                "setting_key": SettingKey.GREET,
-                "setting_label": "How to greet",
-            }
-            mock_update.message.text = "Hi"
-            with pytest.raises(ValueError):
-                await save_setting(mock_update, mock_context)
-
-    @pytest.mark.asyncio
-    async def test_handle_ignore_email_command(self, mock_update, mock_context):
-        user = SimpleNamespace(id=1, telegram_chat_id=123)
-        user_service = AsyncMock()
-        user_service.get_user_by_telegram_chat_id = AsyncMock(return_value=user)
-        user_service.get_setting = AsyncMock(return_value=[])
-        user_service.set_setting = AsyncMock()
-
-        with patch(
-            "the_assistant.integrations.telegram.telegram_client.get_user_service",
-            return_value=user_service,
-        ):
-            mock_context.args = ["*@spam.com"]
-            await handle_ignore_email_command(mock_update, mock_context)
+    async def test_handle_ignore_email_command(
+        self, mock_update, mock_context, user_service
+    ):
+        user_service.get_user_by_telegram_chat_id.return_value = REGISTERED_USER
+        user_service.get_setting.return_value = []
+
+        mock_context.args = ["*@spam.com"]
+        await handle_ignore_email_command(mock_update, mock_context)
 
         user_service.set_setting.assert_awaited_once_with(
             1, SettingKey.IGNORE_EMAILS, ["*@spam.com"]
         )
         assert mock_update.message.reply_text.called
 
-    @pytest.mark.asyncio
-    async def test_memory_add_command(self, mock_update, mock_context):
-        user = SimpleNamespace(id=1, telegram_chat_id=123)
-        user_service = AsyncMock()
-        user_service.get_user_by_telegram_chat_id = AsyncMock(return_value=user)
-        user_service.get_setting = AsyncMock(return_value={})
-        user_service.set_setting = AsyncMock()
-
-        with (
-            patch(
-                "the_assistant.integrations.telegram.telegram_client.get_user_service",
-                return_value=user_service,
-            ),
-            patch(
-                "the_assistant.integrations.telegram.telegram_client.datetime"
-            ) as mock_dt,
-        ):
-            mock_dt.now.return_value = datetime(2024, 1, 1, tzinfo=UTC)
-            mock_dt.UTC = UTC
-            mock_context.args = ["remember this"]
-            await handle_memory_add_command(mock_update, mock_context)
+    async def test_memory_add_command(self, mock_update, mock_context, user_service):
+        user_service.get_user_by_telegram_chat_id.return_value = REGISTERED_USER
+        user_service.get_setting.return_value = {}
+
+        mock_context.args = ["remember this"]
+        await handle_memory_add_command(mock_update, mock_context)
 
         assert user_service.set_setting.await_count == 1
-        call_args = user_service.set_setting.call_args[0]
-        assert call_args[0] == 1
-        assert call_args[1] == SettingKey.MEMORIES
-        memories = call_args[2]
-        assert list(memories.values())[0]["user_input"] == "remember this"
-
-    @pytest.mark.asyncio
-    async def test_memory_command_lists(self, mock_update, mock_context):
-        user = SimpleNamespace(id=1, telegram_chat_id=123)
+        user_id, key, memories = user_service.set_setting.call_args.args
+        assert (user_id, key) == (REGISTERED_USER.id, SettingKey.MEMORIES)
+        assert memories["2024-01-01 00:00:00"]["user_input"] == "remember this"
+
+    async def test_memory_command_lists(self, mock_update, mock_context, user_service):
         mems = {
             "2024-01-02 00:00:00": {"user_input": "b"},
             "2024-01-01 00:00:00": {"user_input": "a"},
         }
-        user_service = AsyncMock()
-        user_service.get_user_by_telegram_chat_id = AsyncMock(return_value=user)
-        user_service.get_setting = AsyncMock(return_value=mems)
+        user_service.get_user_by_telegram_chat_id.return_value = REGISTERED_USER
+        user_service.get_setting.return_value = mems
 
-        with patch(
-            "the_assistant.integrations.telegram.telegram_client.get_user_service",
-            return_value=user_service,
-        ):
-            await handle_memory_command(mock_update, mock_context)
+        await handle_memory_command(mock_update, mock_context)
 
         assert mock_update.message.reply_text.called
         msg = mock_update.message.reply_text.call_args[0][0]
         assert "1." in msg and "2." in msg
 
-    @pytest.mark.asyncio
-    async def test_memory_delete_command(self, mock_update, mock_context):
-        user = SimpleNamespace(id=1, telegram_chat_id=123)
+    async def test_memory_delete_command(self, mock_update, mock_context, user_service):
         mems = {
             "2024-01-01 00:00:00": {"user_input": "a"},
             "2024-01-02 00:00:00": {"user_input": "b"},
         }
-        user_service = AsyncMock()
-        user_service.get_user_by_telegram_chat_id = AsyncMock(return_value=user)
-        user_service.get_setting = AsyncMock(return_value=mems)
-        user_service.set_setting = AsyncMock()
-
-        with patch(
-            "the_assistant.integrations.telegram.telegram_client.get_user_service",
-            return_value=user_service,
-        ):
-            mock_context.args = ["1"]
-            # Use start_memory_delete instead of handle_memory_delete_command
-            # since the latter is now just a stub
+        user_service.get_user_by_telegram_chat_id.return_value = REGISTERED_USER
+        user_service.get_setting.return_value = mems
 
-            await start_memory_delete(mock_update, mock_context)
+        mock_context.args = ["1"]
+        # Use start_memory_delete instead of handle_memory_delete_command
+        # since the latter is now just a stub
+        await start_memory_delete(mock_update, mock_context)
 
         assert user_service.set_setting.await_count == 1
         args = user_service.set_setting.call_args[0]
         assert len(args[2]) == 1
 
-    @pytest.mark.asyncio
-    async def test_add_task_command(self, mock_update, mock_context):
-        user = SimpleNamespace(id=1, telegram_chat_id=123)
-        user_service = AsyncMock()
-        user_service.get_user_by_telegram_chat_id = AsyncMock(return_value=user)
-        user_service.create_task = AsyncMock()
+    async def test_add_task_command(
+        self, mock_update, mock_context, user_service, task_parser
+    ):
+        user_service.get_user_by_telegram_chat_id.return_value = REGISTERED_USER
 
-        parser = AsyncMock()
-        parser.parse.return_value = ("daily 6pm", "say hi")
+        task_parser.parse.return_value = ("daily 6pm", "say hi")
 
-        with (
-            patch(
-                "the_assistant.integrations.telegram.telegram_client.get_user_service",
-                return_value=user_service,
-            ),
-            patch(
-                "the_assistant.integrations.llm.TaskParser",
-                return_value=parser,
-            ),
-        ):
-            mock_context.args = ["every", "day", "at", "6pm", "say", "hi"]
-            await handle_add_task_command(mock_update, mock_context)
+        mock_context.args = ["every", "day", "at", "6pm", "say", "hi"]
+        await handle_add_task_command(mock_update, mock_context)
 
-        parser.parse.assert_awaited_once_with("every day at 6pm say hi")
+        task_parser.parse.assert_awaited_once_with("every day at 6pm say hi")
         user_service.create_task.assert_awaited_once_with(
-            user.id,
+            REGISTERED_USER.id,
             "every day at 6pm say hi",
             schedule="daily 6pm",
             instruction="say hi",
         )
         assert mock_update.message.reply_text.called
 
-    @pytest.mark.asyncio
-    async def test_add_task_command_unregistered(self, mock_update, mock_context):
-        user_service = AsyncMock()
-        user_service.get_user_by_telegram_chat_id = AsyncMock(return_value=None)
+    async def test_add_task_command_parse_failure(
+        self, mock_update, mock_context, user_service, task_parser
+    ):
+        user_service.get_user_by_telegram_chat_id.return_value = REGISTERED_USER
 
-        with patch(
-            "the_assistant.integrations.telegram.telegram_client.get_user_service",
-            return_value=user_service,
-        ):
-            mock_context.args = ["do", "something"]
-            await handle_add_task_command(mock_update, mock_context)
+        task_parser.parse.return_value = ("", "say hi")
 
-        assert mock_update.message.reply_text.called
-        assert "register" in mock_update.message.reply_text.call_args[0][0].lower()
-
-    @pytest.mark.asyncio
-    async def test_add_task_command_parse_failure(self, mock_update, mock_context):
-        user = SimpleNamespace(id=1, telegram_chat_id=123)
-        user_service = AsyncMock()
-        user_service.get_user_by_telegram_chat_id = AsyncMock(return_value=user)
-        user_service.create_task = AsyncMock()
-
-        parser = AsyncMock()
-        parser.parse.return_value = ("", "say hi")
-
-        with (
-            patch(
-                "the_assistant.integrations.telegram.telegram_client.get_user_service",
-                return_value=user_service,
-            ),
-            patch(
-                "the_assistant.integrations.llm.TaskParser",
-                return_value=parser,
-            ),
-        ):
-            mock_context.args = ["some", "text"]
-            await handle_add_task_command(mock_update, mock_context)
+        mock_context.args = ["some", "text"]
+        await handle_add_task_command(mock_update, mock_context)
 
-        parser.parse.assert_awaited_once_with("some text")
+        task_parser.parse.assert_awaited_once_with("some text")
         user_service.create_task.assert_not_called()
         assert mock_update.message.reply_text.called
         assert "parse" in mock_update.message.reply_text.call_args[0][0].lower()
 
-    @pytest.mark.asyncio
-    async def test_add_countdown_command(self, mock_update, mock_context):
-        user = SimpleNamespace(id=1, telegram_chat_id=123)
-        user_service = AsyncMock()
-        user_service.get_user_by_telegram_chat_id = AsyncMock(return_value=user)
-        user_service.create_countdown = AsyncMock()
+    async def test_add_countdown_command(
+        self, mock_update, mock_context, user_service, countdown_parser
+    ):
+        user_service.get_user_by_telegram_chat_id.return_value = REGISTERED_USER
 
-        parser = AsyncMock()
-        parser.parse.return_value = (datetime(2025, 1, 1, tzinfo=UTC), "party")
+        countdown_parser.parse.return_value = (
+            datetime(2025, 1, 1, tzinfo=UTC),
+            "party",
+        )
 
-        with (
-            patch(
-                "the_assistant.integrations.telegram.telegram_client.get_user_service",
-                return_value=user_service,
-            ),
-            patch(
-                "the_assistant.integrations.llm.CountdownParser",
-                return_value=parser,
-            ),
-        ):
-            mock_context.args = ["party", "on", "2025-01-01"]
-            await handle_add_countdown_command(mock_update, mock_context)
+        mock_context.args = ["party", "on", "2025-01-01"]
+        await handle_add_countdown_command(mock_update, mock_context)
 
-        parser.parse.assert_awaited_once_with("party on 2025-01-01")
+        countdown_parser.parse.assert_awaited_once_with("party on 2025-01-01")
         user_service.create_countdown.assert_awaited_once()
         assert mock_update.message.reply_text.called
 
-    @pytest.mark.asyncio
-    async def test_add_countdown_command_unregistered(self, mock_update, mock_context):
-        user_service = AsyncMock()
-        user_service.get_user_by_telegram_chat_id = AsyncMock(return_value=None)
+    async def test_add_countdown_command_parse_failure(
+        self, mock_update, mock_context, user_service, countdown_parser
+    ):
+        user_service.get_user_by_telegram_chat_id.return_value = REGISTERED_USER
 
-        with patch(
-            "the_assistant.integrations.telegram.telegram_client.get_user_service",
-            return_value=user_service,
-        ):
-            mock_context.args = ["party"]
-            await handle_add_countdown_command(mock_update, mock_context)
+        countdown_parser.parse.return_value = (None, "party")
 
-        assert mock_update.message.reply_text.called
-        assert "register" in mock_update.message.reply_text.call_args[0][0].lower()
-
-    @pytest.mark.asyncio
-    async def test_add_countdown_command_parse_failure(self, mock_update, mock_context):
-        user = SimpleNamespace(id=1, telegram_chat_id=123)
-        user_service = AsyncMock()
-        user_service.get_user_by_telegram_chat_id = AsyncMock(return_value=user)
-        user_service.create_countdown = AsyncMock()
-
-        parser = AsyncMock()
-        parser.parse.return_value = (None, "party")
-
-        with (
-            patch(
-                "the_assistant.integrations.telegram.telegram_client.get_user_service",
-                return_value=user_service,
-            ),
-            patch(
-                "the_assistant.integrations.llm.CountdownParser",
-                return_value=parser,
-            ),
-        ):
-            mock_context.args = ["some", "text"]
-            await handle_add_countdown_command(mock_update, mock_context)
+        mock_context.args = ["some", "text"]
+        await handle_add_countdown_command(mock_update, mock_context)
 
-        parser.parse.assert_awaited_once_with("some text")
+        countdown_parser.parse.assert_awaited_once_with("some text")
         user_service.create_countdown.assert_not_called()
         assert mock_update.message.reply_text.called
         assert "parse" in mock_update.message.reply_text.call_args[0][0].lower()
@@ -1,11 +1,31 @@
 from datetime import date
-from unittest.mock import patch
 
 import pytest
 
 from the_assistant.integrations.weather.weather_client import WeatherClient
 from the_assistant.models.weather import HourlyForecast, WeatherForecast
 
+GEOCODE_BERLIN = {"results": [{"latitude": 52.52, "longitude": 13.41}]}
+GEOCODE_NOT_FOUND = {"results": []}
+HOURLY_BERLIN = {
+    "hourly": {
+        "time": ["2024-07-10T00:00", "2024-07-10T01:00"],
+        "weathercode": [1, 2],
+        "temperature_2m": [20.0, 19.5],
+    }
+}
+
+
+def _daily(times):
+    return {
+        "daily": {
+            "time": times,
+            "weathercode": [1 + i for i in range(len(times))],
+            "temperature_2m_max": [25 + i for i in range(len(times))],
+            "temperature_2m_min": [15 + i for i in range(len(times))],
+        }
+    }
+
 
 class FakeResponse:
     def __init__(self, payload):
@@ -22,7 +42,6 @@ class FakeResponse:
 class MockAsyncClient:
     def __init__(self, responses):
         self._responses = responses
-        self._index = 0
 
     async def __aenter__(self):
         return self
@@ -31,79 +50,55 @@ class MockAsyncClient:
         return False
 
     async def get(self, *args, **kwargs):
-        response = self._responses[self._index]
-        self._index += 1
-        return FakeResponse(response)
-
-
-@pytest.mark.asyncio
-async def test_get_forecast_success():
-    geocode = {"results": [{"latitude": 52.52, "longitude": 13.41}]}
-    weather = {
-        "daily": {
-            "time": ["2024-07-10"],
-            "weathercode": [1],
-            "temperature_2m_max": [25],
-            "temperature_2m_min": [15],
-        }
-    }
+        return FakeResponse(next(self._responses))
+
+
+@pytest.fixture
+def httpx_responses(monkeypatch):
+    """Queue of JSON payloads served, in order, by the patched httpx client."""
+    responses: list[dict] = []
+    # One iterator shared by every client the code under test opens, so
+    # consecutive requests walk the queue without mutating it.
+    served = iter(responses)
+    monkeypatch.setattr(
+        "httpx.AsyncClient", lambda *args, **kwargs: MockAsyncClient(served)
+    )
+    return responses
+
+
+@pytest.mark.parametrize(
+    "weather",
+    [_daily(["2024-07-10"]), _daily(["2024-07-10", "2024-07-11"])],
+    ids=["one_day", "two_days"],
+)
+async def test_get_forecast_success(httpx_responses, weather):
+    times = weather["daily"]["time"]
     client = WeatherClient()
-    with patch("httpx.AsyncClient", return_value=MockAsyncClient([geocode, weather])):
-        forecasts = await client.get_forecast("Berlin", days=1)
+    httpx_responses.extend([GEOCODE_BERLIN, weather])
+    forecasts = await client.get_forecast("Berlin", days=len(times))
 
     assert isinstance(forecasts, list)
-    assert len(forecasts) == 1
+    assert [f.forecast_date for f in forecasts] == [
+        date.fromisoformat(t) for t in times
+    ]
     forecast = forecasts[0]
     assert isinstance(forecast, WeatherForecast)
     assert forecast.location == "Berlin"
-    assert forecast.forecast_date == date(2024, 7, 10)
     assert forecast.temperature_max == 25
     assert forecast.condition == "Mainly clear"
 
 
-@pytest.mark.asyncio
-async def test_get_forecast_location_not_found():
-    geocode = {"results": []}
+async def test_get_forecast_location_not_found(httpx_responses):
     client = WeatherClient()
-    with patch("httpx.AsyncClient", return_value=MockAsyncClient([geocode])):
-        with pytest.raises(ValueError):
-            await client.get_forecast("Nowhere")
-
+    httpx_responses.append(GEOCODE_NOT_FOUND)
+    with pytest.raises(ValueError):
+        await client.get_forecast("Nowhere")
 
-@pytest.mark.asyncio
-async def test_get_forecast_multiple_days():
-    geocode = {"results": [{"latitude": 52.52, "longitude": 13.41}]}
-    weather = {
-        "daily": {
-            "time": ["2024-07-10", "2024-07-11"],
-            "weathercode": [1, 2],
-            "temperature_2m_max": [25, 26],
-            "temperature_2m_min": [15, 16],
-        }
-    }
-    client = WeatherClient()
-    with patch("httpx.AsyncClient", return_value=MockAsyncClient([geocode, weather])):
-        forecasts = await client.get_forecast("Berlin", days=2)
 
-    assert isinstance(forecasts, list)
-    assert len(forecasts) == 2
-    assert forecasts[0].forecast_date == date(2024, 7, 10)
-    assert forecasts[1].forecast_date == date(2024, 7, 11)
-
-
-@pytest.mark.asyncio
-async def test_get_hourly_forecast_success():
-    geocode = {"results": [{"latitude": 52.52, "longitude": 13.41}]}
-    hourly = {
-        "hourly": {
-            "time": ["2024-07-10T00:00", "2024-07-10T01:00"],
-            "weathercode": [1, 2],
-            "temperature_2m": [20.0, 19.5],
-        }
-    }
+async def test_get_hourly_forecast_success(httpx_responses):
     client = WeatherClient()
-    with patch("httpx.AsyncClient", return_value=MockAsyncClient([geocode, hourly])):
-        result = await client.get_hourly_forecast("Berlin", date(2024, 7, 10))
+    httpx_responses.extend([GEOCODE_BERLIN, HOURLY_BERLIN])
+    result = await client.get_hourly_forecast("Berlin", date(2024, 7, 10))
 
     assert isinstance(result, list)
     assert len(result) == 2
@@ -1,10 +1,16 @@
 """Tests for Temporal activities."""
 
+from dataclasses import replace
 from datetime import UTC, date, datetime, timedelta
-from unittest.mock import AsyncMock, patch
+from types import SimpleNamespace
 
 import pytest
 
+from the_assistant.activities import (
+    google_activities,
+    obsidian_activities,
+    weather_activities,
+)
 from the_assistant.activities.google_activities import (
     GetCalendarEventsInput,
     GetEmailsInput,
@@ -35,60 +41,150 @@ from the_assistant.models.google import CalendarEvent, GmailMessage
 from the_assistant.models.weather import WeatherForecast
 
 
+class StubGoogleClient:
+    """Stand-in for ``GoogleClient`` that records the calls it receives."""
+
+    def __init__(self) -> None:
+        self.authenticated = True
+        self.events: list[CalendarEvent] = []
+        self.emails: list[GmailMessage] = []
+        self.calls: list[tuple[str, dict]] = []
+
+    async def is_authenticated(self) -> bool:
+        self.calls.append(("is_authenticated", {}))
+        return self.authenticated
+
+    async def get_calendar_events(self, **kwargs) -> list[CalendarEvent]:
+        self.calls.append(("get_calendar_events", kwargs))
+        return self.events
+
+    async def get_upcoming_events(self, **kwargs) -> list[CalendarEvent]:
+        self.calls.append(("get_upcoming_events", kwargs))
+        return self.events
+
+    async def get_events_by_date(self, **kwargs) -> list[CalendarEvent]:
+        self.calls.append(("get_events_by_date", kwargs))
+        return self.events
+
+    async def get_emails(self, **kwargs) -> list[GmailMessage]:
+        self.calls.append(("get_emails", kwargs))
+        return self.emails
+
+
+class StubObsidianClient:
+    """Stand-in for ``ObsidianClient`` that records the filters it is given."""
+
+    def __init__(self) -> None:
+        self.opened_with: list[tuple[str, int]] = []
+        self.filters_seen: list[NoteFilters | None] = []
+
+    def open(self, vault_path: str, user_id: int) -> "StubObsidianClient":
+        """Replacement for the ``ObsidianClient`` constructor."""
+        self.opened_with.append((vault_path, user_id))
+        return self
+
+    async def get_notes(self, filters=None) -> list:
+        self.filters_seen.append(filters)
+        return []
+
+
+class StubWeatherClient:
+    """Stand-in for ``WeatherClient`` that records forecast requests."""
+
+    def __init__(self, forecasts: list[WeatherForecast] | None = None) -> None:
+        self.forecasts = forecasts or []
+        self.requested: list[tuple[str, int]] = []
+
+    async def get_forecast(self, location: str, days: int = 16) -> list:
+        self.requested.append((location, days))
+        return self.forecasts
+
+
+class StubUserService:
+    """Stand-in for ``UserService`` serving settings from a dict."""
+
+    def __init__(self, settings: dict[str, str]) -> None:
+        self.settings = settings
+        self.requested: list[tuple[int, str]] = []
+
+    async def get_setting(self, user_id: int, key: str) -> str | None:
+        self.requested.append((user_id, key))
+        return self.settings.get(key)
+
+
+@pytest.fixture
+def mock_google_client():
+    """Authenticated Google client stub with no events or emails."""
+    return StubGoogleClient()
+
+
+@pytest.fixture
+def _patch_get_google_client(monkeypatch, mock_google_client):
+    """Make the Google activities use ``mock_google_client``."""
+    monkeypatch.setattr(
+        google_activities, "get_google_client", lambda *args: mock_google_client
+    )
+
+
+EVENT_START = datetime(2024, 7, 10, 9, 0, tzinfo=UTC)
+
+
+@pytest.fixture(scope="module")
+def sample_events():
+    """Sample calendar events, shared by the module since tests only read them.
+
+    The activities pass these through untouched, so validation is skipped.
+    """
+    return [
+        CalendarEvent.model_construct(
+            id="event1",
+            summary="Test Event 1",
+            start_time=EVENT_START,
+            end_time=EVENT_START + timedelta(hours=1),
+            description="Test description",
+            location="Test location",
+        ),
+        CalendarEvent.model_construct(
+            id="event2",
+            summary="Test Event 2",
+            start_time=EVENT_START + timedelta(hours=2),
+            end_time=EVENT_START + timedelta(hours=3),
+            description="Another test",
+            location="Another location",
+        ),
+    ]
+
+
+@pytest.fixture(scope="module")
+def sample_emails():
+    """Sample Gmail messages, shared by the module since tests only read them."""
+    return [
+        GmailMessage(
+            id="m1",
+            thread_id="t1",
+            snippet="hi",
+            subject="Hello",
+            sender="sender@example.com",
+            body="Body",
+        )
+    ]
+
+
+@pytest.mark.usefixtures("_patch_get_google_client")
 class TestGoogleActivities:
     """Test Google Calendar activities."""
 
-    @pytest.fixture
-    def mock_google_client(self):
-        """Mock Google client."""
-        client = AsyncMock()
-        client.is_authenticated.return_value = True
-        client.get_calendar_events.return_value = []
-        client.get_upcoming_events.return_value = []
-        client.get_events_by_date.return_value = []
-        return client
-
-    @pytest.fixture
-    def sample_events(self):
-        """Sample calendar events."""
-        return [
-            CalendarEvent(
-                id="event1",
-                summary="Test Event 1",
-                start_time=datetime.now(UTC),
-                end_time=datetime.now(UTC) + timedelta(hours=1),
-                description="Test description",
-                location="Test location",
-            ),
-            CalendarEvent(
-                id="event2",
-                summary="Test Event 2",
-                start_time=datetime.now(UTC) + timedelta(hours=2),
-                end_time=datetime.now(UTC) + timedelta(hours=3),
-                description="Another test",
-                location="Another location",
-            ),
-        ]
-
-    @patch("the_assistant.activities.google_activities.GoogleClient")
-    @patch("the_assistant.activities.google_activities.get_settings")
-    def test_get_google_client_success(self, mock_get_settings, mock_google_client):
+    def test_get_google_client_success(self, monkeypatch):
         """Test successful Google client creation."""
-        settings = AsyncMock()
-        mock_get_settings.return_value = settings
+        monkeypatch.setattr(google_activities, "GoogleClient", SimpleNamespace)
 
         client = get_google_client(1)
 
-        mock_google_client.assert_called_once()
-        assert client is not None
+        assert client == SimpleNamespace(user_id=1, account=None)
 
-    @patch("the_assistant.activities.google_activities.get_google_client")
-    async def test_get_calendar_events_success(
-        self, mock_get_client, mock_google_client, sample_events
-    ):
+    async def test_get_calendar_events_success(self, mock_google_client, sample_events):
         """Test successful calendar events retrieval."""
-        mock_get_client.return_value = mock_google_client
-        mock_google_client.get_calendar_events.return_value = sample_events
+        mock_google_client.events = sample_events
 
         input_data = GetCalendarEventsInput(
             user_id=1, calendar_id="primary", max_results=10
@@ -96,30 +192,38 @@ class TestGoogleActivities:
         result = await get_calendar_events(input_data)
 
         assert result == sample_events
-        mock_google_client.is_authenticated.assert_called_once()
-        mock_google_client.get_calendar_events.assert_called_once_with(
-            calendar_id="primary", time_min=None, time_max=None, max_results=10
-        )
+        assert mock_google_client.calls == [
+            ("is_authenticated", {}),
+            (
+                "get_calendar_events",
+                {
+                    "calendar_id": "primary",
+                    "time_min": None,
+                    "time_max": None,
+                    "max_results": 10,
+                },
+            ),
+        ]
 
-    @patch("the_assistant.activities.google_activities.get_google_client")
-    async def test_get_calendar_events_not_authenticated(
-        self, mock_get_client, mock_google_client
-    ):
-        """Test calendar events retrieval when user is not authenticated."""
-        mock_get_client.return_value = mock_google_client
-        mock_google_client.is_authenticated.return_value = False
+    @pytest.mark.parametrize(
+        ("input_cls", "activity_fn"),
+        [
+            (GetCalendarEventsInput, get_calendar_events),
+            (GetUpcomingEventsInput, get_upcoming_events),
+            (GetEmailsInput, get_emails),
+        ],
+        ids=["calendar_events", "upcoming_events", "emails"],
+    )
+    async def test_not_authenticated(self, mock_google_client, input_cls, activity_fn):
+        """Test Google activities refuse to run for unauthenticated users."""
+        mock_google_client.authenticated = False
 
-        input_data = GetCalendarEventsInput(user_id=1)
         with pytest.raises(ValueError, match="User 1 is not authenticated with Google"):
-            await get_calendar_events(input_data)
+            await activity_fn(input_cls(user_id=1))
 
-    @patch("the_assistant.activities.google_activities.get_google_client")
-    async def test_get_upcoming_events_success(
-        self, mock_get_client, mock_google_client, sample_events
-    ):
+    async def test_get_upcoming_events_success(self, mock_google_client, sample_events):
         """Test successful upcoming events retrieval."""
-        mock_get_client.return_value = mock_google_client
-        mock_google_client.get_upcoming_events.return_value = sample_events
+        mock_google_client.events = sample_events
 
         input_data = GetUpcomingEventsInput(
             user_id=1, days_ahead=7, calendar_id="primary"
@@ -127,131 +231,93 @@ class TestGoogleActivities:
         result = await get_upcoming_events(input_data)
 
         assert result == sample_events
-        mock_google_client.is_authenticated.assert_called_once()
-        mock_google_client.get_upcoming_events.assert_called_once_with(
-            days_ahead=7, calendar_id="primary"
-        )
-
-    @patch("the_assistant.activities.google_activities.get_google_client")
-    async def test_get_upcoming_events_not_authenticated(
-        self, mock_get_client, mock_google_client
-    ):
-        """Test upcoming events retrieval when user is not authenticated."""
-        mock_get_client.return_value = mock_google_client
-        mock_google_client.is_authenticated.return_value = False
-
-        input_data = GetUpcomingEventsInput(user_id=1)
-        with pytest.raises(ValueError, match="User 1 is not authenticated with Google"):
-            await get_upcoming_events(input_data)
+        assert mock_google_client.calls == [
+            ("is_authenticated", {}),
+            ("get_upcoming_events", {"days_ahead": 7, "calendar_id": "primary"}),
+        ]
 
-    @patch("the_assistant.activities.google_activities.get_settings")
-    @patch("the_assistant.activities.google_activities.get_google_client")
     async def test_get_events_by_date_success(
-        self, mock_get_client, mock_get_settings, mock_google_client, sample_events
+        self, monkeypatch, mock_google_client, sample_events
     ):
         """Test successful events by date retrieval."""
-        settings = AsyncMock()
-        settings.google_calendar_id = "test-calendar"
-        mock_get_settings.return_value = settings
-        mock_get_client.return_value = mock_google_client
-        mock_google_client.get_events_by_date.return_value = sample_events
+        settings = SimpleNamespace(google_calendar_id="test-calendar")
+        monkeypatch.setattr(google_activities, "get_settings", lambda: settings)
+        mock_google_client.events = sample_events
 
-        target_date = datetime.now(UTC)
+        target_date = EVENT_START
         input_data = GetEventsByDateInput(user_id=1, target_date=target_date)
         result = await get_events_by_date(input_data)
 
         assert result == sample_events
-        mock_google_client.is_authenticated.assert_called_once()
-        mock_google_client.get_events_by_date.assert_called_once_with(
-            target_date=target_date, calendar_id="test-calendar"
-        )
+        assert mock_google_client.calls == [
+            ("is_authenticated", {}),
+            (
+                "get_events_by_date",
+                {"target_date": target_date, "calendar_id": "test-calendar"},
+            ),
+        ]
 
-    @patch("the_assistant.activities.google_activities.get_events_by_date")
-    async def test_get_today_events(self, mock_get_events_by_date, sample_events):
+    async def test_get_today_events(self, monkeypatch, sample_events, frozen_datetime):
         """Test get today's events."""
-        mock_get_events_by_date.return_value = sample_events
+        requested = []
+
+        async def fake_get_events_by_date(input):
+            requested.append(input)
+            return sample_events
+
+        monkeypatch.setattr(google_activities, "datetime", frozen_datetime(EVENT_START))
+        monkeypatch.setattr(
+            google_activities, "get_events_by_date", fake_get_events_by_date
+        )
 
         input_data = GetTodayEventsInput(user_id=1, calendar_id="primary")
         result = await get_today_events(input_data)
 
         assert result == sample_events
-        mock_get_events_by_date.assert_called_once()
-        # Check that the input passed to get_events_by_date is correct
-        call_args = mock_get_events_by_date.call_args
-        input_arg = call_args[0][0]  # First positional argument
-        assert input_arg.user_id == 1
-        assert input_arg.calendar_id == "primary"
-        # The target_date should be today (within a few seconds)
-        now = datetime.now(UTC)
-        assert abs((input_arg.target_date - now).total_seconds()) < 5
+        assert requested == [
+            GetEventsByDateInput(
+                user_id=1, target_date=EVENT_START, calendar_id="primary"
+            )
+        ]
 
 
 class TestObsidianActivities:
     """Test Obsidian vault activities."""
 
-    @pytest.fixture
-    def mock_obsidian_client(self):
-        """Mock Obsidian client."""
-        client = AsyncMock()
-        client.get_notes.return_value = []  # NoteList is just list[ObsidianNote]
-        return client
-
-    @patch("the_assistant.activities.obsidian_activities.get_settings")
-    @patch("the_assistant.activities.obsidian_activities.ObsidianClient")
-    async def test_scan_vault_notes_success(
-        self, mock_obsidian_client_class, mock_get_settings, mock_obsidian_client
-    ):
+    async def test_scan_vault_notes_success(self, monkeypatch):
         """Test successful vault scanning."""
-
-        settings = AsyncMock()
-        settings.obsidian_vault_path = "/path/to/vault"
-        mock_get_settings.return_value = settings
-        mock_obsidian_client_class.return_value = mock_obsidian_client
-
-        expected_result = []  # NoteList is just list[ObsidianNote]
-        mock_obsidian_client.get_notes.return_value = expected_result
+        settings = SimpleNamespace(obsidian_vault_path="/path/to/vault")
+        client = StubObsidianClient()
+        monkeypatch.setattr(obsidian_activities, "get_settings", lambda: settings)
+        monkeypatch.setattr(obsidian_activities, "ObsidianClient", client.open)
 
         input_data = ScanVaultNotesInput(user_id=1)
         result = await scan_vault_notes(input_data)
 
-        assert result == expected_result
-        mock_obsidian_client_class.assert_called_once_with("/path/to/vault", user_id=1)
-        mock_obsidian_client.get_notes.assert_called_once_with(None)
+        assert result == []
+        assert client.opened_with == [("/path/to/vault", 1)]
+        assert client.filters_seen == [None]
 
-    @patch("the_assistant.activities.obsidian_activities.get_settings")
-    @patch("the_assistant.activities.obsidian_activities.ObsidianClient")
-    async def test_scan_vault_notes_with_filters(
-        self, mock_obsidian_client_class, mock_get_settings, mock_obsidian_client
-    ):
+    async def test_scan_vault_notes_with_filters(self, monkeypatch):
         """Test vault scanning with filters."""
-
-        settings = AsyncMock()
-        settings.obsidian_vault_path = "/path/to/vault"
-        mock_get_settings.return_value = settings
-        mock_obsidian_client_class.return_value = mock_obsidian_client
+        settings = SimpleNamespace(obsidian_vault_path="/path/to/vault")
+        client = StubObsidianClient()
+        monkeypatch.setattr(obsidian_activities, "get_settings", lambda: settings)
+        monkeypatch.setattr(obsidian_activities, "ObsidianClient", client.open)
 
         filters = NoteFilters(tags=["test"], tag_operator="AND")
-        expected_result = []  # NoteList is just list[ObsidianNote]
-        mock_obsidian_client.get_notes.return_value = expected_result
-
         input_data = ScanVaultNotesInput(user_id=1, filters=filters)
         result = await scan_vault_notes(input_data)
 
-        assert result == expected_result
-        mock_obsidian_client_class.assert_called_once_with("/path/to/vault", user_id=1)
-        mock_obsidian_client.get_notes.assert_called_once_with(filters)
+        assert result == []
+        assert client.opened_with == [("/path/to/vault", 1)]
+        assert client.filters_seen == [filters]
 
 
 class TestWeatherActivities:
     """Test weather forecast activities."""
 
-    @pytest.mark.asyncio
-    @patch("the_assistant.activities.weather_activities.get_user_service")
-    @patch("the_assistant.activities.weather_activities.WeatherClient")
-    async def test_get_weather_forecast_success(
-        self, mock_client_class, mock_get_service
-    ):
-        mock_client = AsyncMock()
+    async def test_get_weather_forecast_success(self, monkeypatch):
         forecast = WeatherForecast(
             location="Paris",
             forecast_date=date(2024, 7, 10),
@@ -259,145 +325,116 @@ class TestWeatherActivities:
             temperature_max=25,
             temperature_min=15,
         )
-        mock_client.get_forecast.return_value = [forecast]
-        mock_client_class.return_value = mock_client
-
-        mock_service = AsyncMock()
-        mock_service.get_setting.return_value = "Paris"
-        mock_get_service.return_value = mock_service
+        client = StubWeatherClient([forecast])
+        service = StubUserService({"location": "Paris"})
+        monkeypatch.setattr(weather_activities, "WeatherClient", lambda: client)
+        monkeypatch.setattr(weather_activities, "get_user_service", lambda: service)
 
         input_data = GetWeatherForecastInput(user_id=1)
         result = await get_weather_forecast(input_data)
 
         assert result == [forecast]
-        mock_service.get_setting.assert_awaited_once_with(1, "location")
-        mock_client.get_forecast.assert_awaited_once_with("Paris", days=1)
-
-    @pytest.mark.asyncio
-    @patch("the_assistant.activities.weather_activities.get_user_service")
-    @patch("the_assistant.activities.weather_activities.WeatherClient")
-    async def test_get_weather_forecast_no_location(
-        self, mock_client_class, mock_get_service
-    ):
-        mock_client = AsyncMock()
-        mock_client_class.return_value = mock_client
+        assert service.requested == [(1, "location")]
+        assert client.requested == [("Paris", 1)]
 
-        mock_service = AsyncMock()
-        mock_service.get_setting.return_value = None
-        mock_get_service.return_value = mock_service
+    async def test_get_weather_forecast_no_location(self, monkeypatch):
+        client = StubWeatherClient()
+        service = StubUserService({})
+        monkeypatch.setattr(weather_activities, "WeatherClient", lambda: client)
+        monkeypatch.setattr(weather_activities, "get_user_service", lambda: service)
 
         input_data = GetWeatherForecastInput(user_id=1)
         result = await get_weather_forecast(input_data)
 
         assert result == []
-        mock_service.get_setting.assert_awaited_once_with(1, "location")
-        mock_client.get_forecast.assert_not_called()
+        assert service.requested == [(1, "location")]
+        assert client.requested == []
 
 
+@pytest.mark.usefixtures("_patch_get_google_client")
 class TestEmailActivities:
     """Test Gmail-related activities."""
 
-    @pytest.fixture
-    def mock_google_client(self):
-        client = AsyncMock()
-        client.is_authenticated.return_value = True
-        client.get_emails.return_value = []
-        return client
-
-    @pytest.fixture
-    def sample_emails(self):
-        return [
-            GmailMessage(
-                id="m1",
-                thread_id="t1",
-                snippet="hi",
-                subject="Hello",
-                sender="sender@example.com",
-                body="Body",
-            )
-        ]
-
-    @pytest.mark.asyncio
-    @patch("the_assistant.activities.google_activities.get_google_client")
-    async def test_get_emails_success(
-        self, mock_get_client, mock_google_client, sample_emails
-    ):
-        mock_get_client.return_value = mock_google_client
-        mock_google_client.get_emails.return_value = sample_emails
+    async def test_get_emails_success(self, mock_google_client, sample_emails):
+        mock_google_client.emails = sample_emails
 
         input_data = GetEmailsInput(user_id=1, unread_only=True, max_results=5)
         result = await get_emails(input_data)
 
         assert result == sample_emails
-        mock_google_client.is_authenticated.assert_called_once()
-        mock_google_client.get_emails.assert_called_once_with(
-            query=None,
-            unread_only=True,
-            sender=None,
-            max_results=5,
-            include_body=True,
-            ignored_senders=None,
-        )
-
-    @pytest.mark.asyncio
-    @patch("the_assistant.activities.google_activities.get_google_client")
-    async def test_get_emails_not_authenticated(
-        self, mock_get_client, mock_google_client
-    ):
-        mock_get_client.return_value = mock_google_client
-        mock_google_client.is_authenticated.return_value = False
-
-        input_data = GetEmailsInput(user_id=1)
-        with pytest.raises(ValueError, match="User 1 is not authenticated with Google"):
-            await get_emails(input_data)
-
+        assert mock_google_client.calls == [
+            ("is_authenticated", {}),
+            (
+                "get_emails",
+                {
+                    "query": None,
+                    "unread_only": True,
+                    "sender": None,
+                    "max_results": 5,
+                    "include_body": True,
+                    "ignored_senders": None,
+                },
+            ),
+        ]
 
-class TestMessagesActivities:
-    """Test message building helpers."""
 
-    @pytest.mark.asyncio
-    async def test_build_daily_briefing(self):
-        today = datetime.now(UTC)
-        tomorrow = today + timedelta(days=1)
-        event_today = CalendarEvent(
-            id="1",
-            summary="Today Event",
-            start_time=today,
-            end_time=today,
-        )
-        event_tomorrow = CalendarEvent(
-            id="2",
-            summary="Tomorrow Event",
-            start_time=tomorrow,
-            end_time=tomorrow,
-        )
-        forecast = WeatherForecast(
+@pytest.fixture(scope="module")
+def briefing_payload():
+    """Daily briefing input with one item of each kind."""
+    tomorrow = EVENT_START + timedelta(days=1)
+    return DailyBriefingInput(
+        user_id=1,
+        today_events=[
+            CalendarEvent(
+                id="1",
+                summary="Today Event",
+                start_time=EVENT_START,
+                end_time=EVENT_START,
+            )
+        ],
+        tomorrow_events=[
+            CalendarEvent(
+                id="2",
+                summary="Tomorrow Event",
+                start_time=tomorrow,
+                end_time=tomorrow,
+            )
+        ],
+        weather=WeatherForecast(
             location="Berlin",
-            forecast_date=date.today(),
+            forecast_date=EVENT_START.date(),
             weather_code=1,
             temperature_max=25,
             temperature_min=15,
-        )
-        email = GmailMessage(
-            id="m1",
-            thread_id="t1",
-            snippet="snippet",
-            subject="Subject",
-            sender="sender@example.com",
-            body="Body",
-        )
-
-        text = await build_daily_briefing(
-            DailyBriefingInput(
-                user_id=1,
-                today_events=[event_today],
-                tomorrow_events=[event_tomorrow],
-                weather=forecast,
-                emails=[email],
+        ),
+        emails=[
+            GmailMessage(
+                id="m1",
+                thread_id="t1",
+                snippet="snippet",
+                subject="Subject",
+                sender="sender@example.com",
+                body="Body",
             )
-        )
+        ],
+    )
+
+
+class TestMessagesActivities:
+    """Test message building helpers."""
 
-        assert "Today's Events" in text
-        assert "Tomorrow's Events" in text
-        assert "Weather" in text
-        assert "Unread Emails" in text
+    @pytest.mark.parametrize(
+        ("overrides", "missing"),
+        [({}, set()), ({"weather": None}, {"Weather"})],
+        ids=["with_all", "no_weather"],
+    )
+    async def test_build_daily_briefing(self, briefing_payload, overrides, missing):
+        text = await build_daily_briefing(replace(briefing_payload, **overrides))
+
+        for section in (
+            "Today's Events",
+            "Tomorrow's Events",
+            "Weather",
+            "Unread Emails",
+        ):
+            assert (section in text) is (section not in missing)
@@ -5,13 +5,17 @@ from langchain_core.messages import AIMessage
 from the_assistant.integrations.llm.countdown_parser import CountdownParser
 
 
-@pytest.mark.asyncio
-async def test_countdown_parser(monkeypatch):
-    class DummyModel(FakeChatModel):
-        async def ainvoke(self, input_data, config=None):
-            return AIMessage(content='{"date": "2025-01-01", "description": "party"}')
+class DummyModel(FakeChatModel):
+    async def ainvoke(self, input_data, config=None):
+        return AIMessage(content='{"date": "2025-01-01", "description": "party"}')
 
-    model = DummyModel()
+
+@pytest.fixture(scope="module")
+def model():
+    return DummyModel()
+
+
+async def test_countdown_parser(model):
     parser = CountdownParser(model=model)
     event_time, description = await parser.parse("party on 2025-01-01")
 
@@ -7,13 +7,24 @@ from fastapi.testclient import TestClient
 
 from the_assistant.main import app
 
+# The app's routes are fixed once the module is imported.
+ROUTE_PATHS = frozenset(route.path for route in app.routes)
+
 
 class TestMainApp:
     """Test the main FastAPI application."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def client(self):
-        """Test client for the FastAPI app."""
+        """Test client for the FastAPI app, shared since no test mutates it."""
+        # Entering the client keeps one event-loop thread for the class
+        # instead of starting a new blocking portal per request.
+        with TestClient(app) as client:
+            yield client
+
+    @pytest.fixture(scope="class")
+    def oauth_client(self):
+        """Test client with the secrets the OAuth routes' settings require."""
         with patch.dict(
             "os.environ",
             {
@@ -22,51 +33,33 @@ class TestMainApp:
             },
             clear=False,
         ):
-            yield TestClient(app)
+            with TestClient(app) as client:
+                yield client
 
     def test_app_creation(self):
         """Test that the app is created successfully."""
         assert app.title == "The Assistant"
         assert app.version == "0.1.0"
 
-    def test_oauth_redirect_with_all_params(self, client):
-        """Test OAuth redirect with all parameters."""
-        response = client.get(
-            "/google/oauth2callback?state=test_state&code=test_code&error=test_error",
-            follow_redirects=False,
+    @pytest.mark.parametrize(
+        ("query", "expected"),
+        [
+            # With an error present the router redirects to auth-error
+            ("?state=test_state&code=test_code&error=test_error", {302}),
+            ("?state=test_state", {200, 302, 422}),
+            ("?code=test_code", {200, 302, 422}),
+            ("?error=access_denied", {200, 302, 422}),
+            ("", {200, 302, 422}),
+        ],
+        ids=["all_params", "state_only", "code_only", "error_only", "no_params"],
+    )
+    def test_oauth_redirect(self, oauth_client, query, expected):
+        """Test the OAuth redirect with various query parameters."""
+        response = oauth_client.get(
+            f"/google/oauth2callback{query}", follow_redirects=False
         )
 
-        # The actual behavior depends on the OAuth router implementation
-        # Since error is present, it will redirect to auth-error
-        assert response.status_code == 302  # The router redirects to auth-error
-
-    def test_oauth_redirect_with_state_only(self, client):
-        """Test OAuth redirect with state parameter only."""
-        response = client.get("/google/oauth2callback?state=test_state")
-
-        # Without code, this will be processed by the OAuth router
-        assert response.status_code in [200, 302, 422]  # Various possible responses
-
-    def test_oauth_redirect_with_code_only(self, client):
-        """Test OAuth redirect with code parameter only."""
-        response = client.get("/google/oauth2callback?code=test_code")
-
-        # Without state, this will be processed by the OAuth router
-        assert response.status_code in [200, 302, 422]  # Various possible responses
-
-    def test_oauth_redirect_with_error_only(self, client):
-        """Test OAuth redirect with error parameter only."""
-        response = client.get("/google/oauth2callback?error=access_denied")
-
-        # Error will be processed by the OAuth router
-        assert response.status_code in [200, 302, 422]  # Various possible responses
-
-    def test_oauth_redirect_no_params(self, client):
-        """Test OAuth redirect with no parameters."""
-        response = client.get("/google/oauth2callback")
-
-        # No params will be processed by the OAuth router
-        assert response.status_code in [200, 302, 422]  # Various possible responses
+        assert response.status_code in expected
 
     def test_auth_success_endpoint(self, client):
         """Test the auth success endpoint."""
@@ -76,12 +69,9 @@ class TestMainApp:
 
     def test_google_oauth_router_included(self):
         """Test that the Google OAuth router is included."""
-        # Check that the router is included by looking at the routes
-        routes = [route.path for route in app.routes]
-
         # The exact paths depend on the router implementation,
         # but we should have some Google OAuth related routes
-        assert any("/google" in route for route in routes)
+        assert any(path.startswith("/google") for path in ROUTE_PATHS)
 
     def test_app_has_correct_metadata(self):
         """Test that the app has correct metadata."""
@@ -92,9 +82,4 @@ class TestMainApp:
 
     def test_app_routes_exist(self):
         """Test that expected routes exist."""
-        routes = [route.path for route in app.routes]
-
-        # Check for our custom routes
-        assert "/google/oauth2callback" in routes
-        assert "/auth-success" in routes
-        assert "/auth-error" in routes
+        assert {"/google/oauth2callback", "/auth-success", "/auth-error"} <= ROUTE_PATHS
@@ -6,6 +6,8 @@ These tests verify the functionality of the shared data models in utils/models.p
 from datetime import date, datetime, timedelta
 from pathlib import Path
 
+import pytest
+
 # Import UTC timezone
 try:
     from datetime import UTC
@@ -14,6 +16,7 @@ except ImportError:
 
     UTC = UTC
 
+from the_assistant.models import google as google_models
 from the_assistant.models.google import CalendarEvent, GmailMessage
 from the_assistant.models.obsidian import (
     Heading,
@@ -22,19 +25,25 @@ from the_assistant.models.obsidian import (
     TaskItem,
 )
 
+NOW = datetime(2025, 1, 15, 12, 0, tzinfo=UTC)
+FUTURE_TIME = NOW + timedelta(minutes=30)
+
+
+@pytest.fixture(autouse=True, scope="module")
+def frozen_time(frozen_datetime):
+    """Freeze the clock the Google models read for every test in this module."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(google_models, "datetime", frozen_datetime(NOW))
+        yield
+
 
 def test_calendar_event_properties():
     """Test CalendarEvent model properties."""
-    # Create a calendar event in the future to ensure is_upcoming is True
-    now = datetime.now(UTC)
-    future_time = now + timedelta(minutes=30)
-    if future_time.date() != now.date():
-        future_time = now + timedelta(seconds=1)
     event = CalendarEvent(
         id="event123",
         summary="Team Meeting",
-        start_time=future_time,
-        end_time=future_time + timedelta(hours=1),
+        start_time=FUTURE_TIME,
+        end_time=FUTURE_TIME + timedelta(hours=1),
         calendar_id="primary",
         description="Weekly team sync",
         location="Conference Room A",
@@ -43,23 +52,18 @@ def test_calendar_event_properties():
 
     # Test properties
     assert event.duration == timedelta(hours=1)
-    assert event.is_upcoming is True  # Since start_time is in the future
-    assert event.is_today is True  # Since start_time is today
+    assert event.is_upcoming is True  # Since start_time is after the frozen now
+    assert event.is_today is True  # Since start_time is on the frozen day
 
 
 def test_calendar_event_recurrence():
     """Test CalendarEvent recurrence properties."""
-    now = datetime.now(UTC)
-    future_time = now + timedelta(minutes=30)
-    if future_time.date() != now.date():
-        future_time = now + timedelta(seconds=1)
-
     # Test non-recurring event
     non_recurring = CalendarEvent(
         id="event1",
         summary="One-time Meeting",
-        start_time=future_time,
-        end_time=future_time + timedelta(hours=1),
+        start_time=FUTURE_TIME,
+        end_time=FUTURE_TIME + timedelta(hours=1),
     )
     assert non_recurring.is_recurring is False
     assert non_recurring.recurrence_description == ""
@@ -69,8 +73,8 @@ def test_calendar_event_recurrence():
     weekly_recurring = CalendarEvent(
         id="event2",
         summary="Weekly Standup",
-        start_time=future_time,
-        end_time=future_time + timedelta(hours=1),
+        start_time=FUTURE_TIME,
+        end_time=FUTURE_TIME + timedelta(hours=1),
         is_recurring=True,
         recurrence_rules=["RRULE:FREQ=WEEKLY;INTERVAL=1"],
         recurring_event_id="recurring123",
@@ -83,8 +87,8 @@ def test_calendar_event_recurrence():
     daily_recurring = CalendarEvent(
         id="event3",
         summary="Daily Standup",
-        start_time=future_time,
-        end_time=future_time + timedelta(hours=1),
+        start_time=FUTURE_TIME,
+        end_time=FUTURE_TIME + timedelta(hours=1),
         is_recurring=True,
         recurrence_rules=["RRULE:FREQ=DAILY"],
     )
@@ -95,8 +99,8 @@ def test_calendar_event_recurrence():
     biweekly_recurring = CalendarEvent(
         id="event4",
         summary="Bi-weekly Review",
-        start_time=future_time,
-        end_time=future_time + timedelta(hours=1),
+        start_time=FUTURE_TIME,
+        end_time=FUTURE_TIME + timedelta(hours=1),
         is_recurring=True,
         recurrence_rules=["RRULE:FREQ=WEEKLY;INTERVAL=2"],
     )
@@ -107,8 +111,8 @@ def test_calendar_event_recurrence():
     monthly_recurring = CalendarEvent(
         id="event5",
         summary="Monthly Review",
-        start_time=future_time,
-        end_time=future_time + timedelta(hours=1),
+        start_time=FUTURE_TIME,
+        end_time=FUTURE_TIME + timedelta(hours=1),
         is_recurring=True,
         recurrence_rules=["RRULE:FREQ=MONTHLY;INTERVAL=1"],
     )
@@ -119,8 +123,8 @@ def test_calendar_event_recurrence():
     yearly_recurring = CalendarEvent(
         id="event6",
         summary="Annual Review",
-        start_time=future_time,
-        end_time=future_time + timedelta(hours=1),
+        start_time=FUTURE_TIME,
+        end_time=FUTURE_TIME + timedelta(hours=1),
         is_recurring=True,
         recurrence_rules=["RRULE:FREQ=YEARLY"],
     )
@@ -131,8 +135,8 @@ def test_calendar_event_recurrence():
     unknown_recurring = CalendarEvent(
         id="event7",
         summary="Unknown Recurrence",
-        start_time=future_time,
-        end_time=future_time + timedelta(hours=1),
+        start_time=FUTURE_TIME,
+        end_time=FUTURE_TIME + timedelta(hours=1),
         is_recurring=True,
         recurrence_rules=["RRULE:FREQ=UNKNOWN"],
     )
@@ -140,29 +144,24 @@ def test_calendar_event_recurrence():
     assert unknown_recurring.recurrence_description == "unknown"
 
 
+BASE_TASK = TaskItem(text="", completed=False, line_number=0)
+
+
 def test_task_item_properties():
     """Test TaskItem model properties."""
     # Create task items with different indentation levels
-    task1 = TaskItem(
-        text="Root task",
-        completed=False,
-        line_number=10,
-        indent_level=0,
-    )
-
-    task2 = TaskItem(
-        text="Nested task",
-        completed=True,
-        line_number=11,
-        indent_level=2,
-        parent_heading="Heading",
+    task1 = BASE_TASK.model_copy(update={"text": "Root task", "line_number": 10})
+    task2 = BASE_TASK.model_copy(
+        update={
+            "text": "Nested task",
+            "completed": True,
+            "line_number": 11,
+            "indent_level": 2,
+            "parent_heading": "Heading",
+        }
     )
-
-    task3 = TaskItem(
-        text="Deeply nested task",
-        completed=False,
-        line_number=12,
-        indent_level=4,
+    task3 = BASE_TASK.model_copy(
+        update={"text": "Deeply nested task", "line_number": 12, "indent_level": 4}
     )
 
     # Test properties
@@ -233,10 +232,15 @@ def test_obsidian_note_properties():
     assert note.end_date == date(2024, 7, 25)
 
 
-def test_obsidian_note_date_parsing():
-    """Test ObsidianNote date parsing with different formats."""
-    # Create notes with different date formats
-    formats = [
+# Only the metadata varies between cases, so copy one validated note per case.
+DATE_TEST_NOTE = ObsidianNote(
+    title="Date Test", path=Path("test.md"), content="Content"
+)
+
+
+@pytest.mark.parametrize(
+    ("date_str", "expected_date"),
+    [
         ("2024-07-15", date(2024, 7, 15)),  # ISO format
         ("07/15/2024", date(2024, 7, 15)),  # US format
         ("15/07/2024", date(2024, 7, 15)),  # European format
@@ -247,16 +251,16 @@ def test_obsidian_note_date_parsing():
         ("Jul 15, 2024", date(2024, 7, 15)),  # Short month
         ("15 July 2024", date(2024, 7, 15)),  # European long
         ("15 Jul 2024", date(2024, 7, 15)),  # European short
-    ]
-
-    for date_str, expected_date in formats:
-        note = ObsidianNote(
-            title="Date Test",
-            path=Path("test.md"),
-            content="Content",
-            metadata={"start_date": date_str},
-        )
-        assert note.start_date == expected_date, f"Failed to parse {date_str}"
+        ("2024-01- 5", date(2024, 1, 5)),  # Space-padded day, as strptime's %d
+        ("1/ 1/2024", date(2024, 1, 1)),  # Space-padded day, month first
+        ("2024- 1-05", None),  # Months are never space-padded
+        ("١٢/١٢/٢٠٢٤", None),  # Non-ASCII digits
+    ],
+)
+def test_obsidian_note_date_parsing(date_str, expected_date):
+    """Test ObsidianNote date parsing with different formats."""
+    note = DATE_TEST_NOTE.model_copy(update={"metadata": {"start_date": date_str}})
+    assert note.start_date == expected_date
 
 
 def test_gmail_message_formatted_date():
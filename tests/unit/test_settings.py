@@ -1,46 +1,46 @@
 """Unit tests for Pydantic settings."""
 
 from pathlib import Path
-from unittest.mock import patch
 
 import pytest
 
 from the_assistant.settings import Settings
 
+MINIMAL_ENV = {
+    "TELEGRAM_TOKEN": "token",
+    "DB_ENCRYPTION_KEY": "key",
+    "JWT_SECRET": "secret",
+    "OBSIDIAN_VAULT_PATH": "/vault",
+}
+
 
 @pytest.fixture
-def minimal_env():
-    with patch.dict(
-        "os.environ",
-        {
-            "TELEGRAM_TOKEN": "token",
-            "DB_ENCRYPTION_KEY": "key",
-            "JWT_SECRET": "secret",
-            "OBSIDIAN_VAULT_PATH": "/vault",
-        },
-        clear=True,
-    ):
-        yield
-
-
-def test_env_overrides():
-    with patch.dict(
-        "os.environ",
-        {
-            "TELEGRAM_TOKEN": "token",
-            "DB_ENCRYPTION_KEY": "key",
-            "JWT_SECRET": "secret",
-            "OBSIDIAN_VAULT_PATH": "/vault",
-            "TEMPORAL_HOST": "test:7233",
-            "GOOGLE_CREDENTIALS_PATH": "test/google.json",
-        },
-        clear=True,
-    ):
-        settings = Settings()
-        assert settings.temporal_host == "test:7233"
-        assert settings.google_credentials_path == Path("test/google.json")
-        assert settings.google_oauth_scopes == [
-            "https://www.googleapis.com/auth/calendar.readonly",
-            "https://www.googleapis.com/auth/gmail.readonly",
-            "https://www.googleapis.com/auth/calendar.events.readonly",
-        ]
+def minimal_env(monkeypatch):
+    for key, value in MINIMAL_ENV.items():
+        monkeypatch.setenv(key, value)
+
+
+DEFAULT_SCOPES = [
+    "https://www.googleapis.com/auth/calendar.readonly",
+    "https://www.googleapis.com/auth/gmail.readonly",
+    "https://www.googleapis.com/auth/calendar.events.readonly",
+]
+
+
+@pytest.mark.parametrize(
+    ("scopes_env", "expected_scopes"),
+    [(None, DEFAULT_SCOPES), ('["a", "b"]', ["a", "b"])],
+    ids=["default_scopes", "scopes_override"],
+)
+def test_env_overrides(minimal_env, monkeypatch, scopes_env, expected_scopes):
+    monkeypatch.setenv("TEMPORAL_HOST", "test:7233")
+    monkeypatch.setenv("GOOGLE_CREDENTIALS_PATH", "test/google.json")
+    if scopes_env is None:
+        monkeypatch.delenv("GOOGLE_OAUTH_SCOPES", raising=False)
+    else:
+        monkeypatch.setenv("GOOGLE_OAUTH_SCOPES", scopes_env)
+
+    settings = Settings()
+    assert settings.temporal_host == "test:7233"
+    assert settings.google_credentials_path == Path("test/google.json")
+    assert settings.google_oauth_scopes == expected_scopes
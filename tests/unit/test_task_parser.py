@@ -4,18 +4,20 @@ from langchain_core.messages import AIMessage
 
 from the_assistant.integrations.llm.task_parser import TaskParser
 
+RESPONSE = AIMessage(content='{"schedule": "daily 6pm", "instruction": "send word"}')
 
-@pytest.mark.asyncio
-async def test_task_parser(monkeypatch):
-    class DummyModel(FakeChatModel):
-        async def ainvoke(self, input_data, config=None):
-            return AIMessage(
-                content='{"schedule": "daily 6pm", "instruction": "send word"}'
-            )
 
-    model = DummyModel()
+class DummyModel(FakeChatModel):
+    async def ainvoke(self, input_data, config=None):
+        return RESPONSE
 
-    parser = TaskParser(model=model)
+
+@pytest.fixture(scope="module")
+def parser():
+    return TaskParser(model=DummyModel())
+
+
+async def test_task_parser(parser):
     schedule, instruction = await parser.parse("every day at 6pm send me a word")
 
     assert schedule == "daily 6pm"
@@ -1,9 +1,8 @@
 """Tests for Telegram activities."""
 
-from unittest.mock import AsyncMock, patch
-
 import pytest
 
+from the_assistant.activities import telegram_activities
 from the_assistant.activities.telegram_activities import (
     SendFormattedMessageInput,
     SendMessageInput,
@@ -12,24 +11,47 @@ from the_assistant.activities.telegram_activities import (
 )
 
 
+class FakeTelegramClient:
+    """Stand-in for ``TelegramClient`` that records what it is asked to send."""
+
+    def __init__(self) -> None:
+        self.user_ids: list[int] = []
+        self.sent: list[dict] = []
+
+    def __call__(self, user_id: int) -> "FakeTelegramClient":
+        """Replacement for the ``TelegramClient`` constructor."""
+        self.user_ids.append(user_id)
+        return self
+
+    async def send_message(self, **kwargs) -> bool:
+        self.sent.append(kwargs)
+        return True
+
+
 class TestTelegramActivities:
     """Test Telegram messaging activities."""
 
     @pytest.fixture
-    def mock_telegram_client(self):
-        """Mock Telegram client."""
-        client = AsyncMock()
-        client.send_message.return_value = True
-        client.validate_credentials.return_value = True
+    def telegram_client(self, monkeypatch):
+        """Fake Telegram client installed in place of ``TelegramClient``."""
+        client = FakeTelegramClient()
+        monkeypatch.setattr(telegram_activities, "TelegramClient", client)
         return client
 
-    @patch("the_assistant.activities.telegram_activities.TelegramClient")
-    async def test_send_message_success(
-        self, mock_telegram_client_class, mock_telegram_client
-    ):
-        """Test successful message sending."""
-        mock_telegram_client_class.return_value = mock_telegram_client
+    @pytest.fixture
+    def sent_inputs(self, monkeypatch):
+        """Inputs passed to ``send_message`` by ``send_formatted_message``."""
+        sent: list[SendMessageInput] = []
+
+        async def fake_send_message(input: SendMessageInput) -> bool:
+            sent.append(input)
+            return True
+
+        monkeypatch.setattr(telegram_activities, "send_message", fake_send_message)
+        return sent
 
+    async def test_send_message_success(self, telegram_client):
+        """Test successful message sending."""
         input_data = SendMessageInput(
             user_id=1, text="Test message", parse_mode="Markdown"
         )
@@ -37,87 +59,42 @@ class TestTelegramActivities:
         result = await send_message(input_data)
 
         assert result is True
-        mock_telegram_client_class.assert_called_once_with(user_id=1)
-        mock_telegram_client.send_message.assert_called_once_with(
-            text="Test message", parse_mode="Markdown"
-        )
+        assert telegram_client.user_ids == [1]
+        assert telegram_client.sent == [
+            {"text": "Test message", "parse_mode": "Markdown"}
+        ]
 
-    @patch("the_assistant.activities.telegram_activities.TelegramClient")
-    async def test_send_message_default_parse_mode(
-        self, mock_telegram_client_class, mock_telegram_client
-    ):
+    async def test_send_message_default_parse_mode(self, telegram_client):
         """Test message sending with default parse mode."""
-        mock_telegram_client_class.return_value = mock_telegram_client
-
         input_data = SendMessageInput(user_id=1, text="Test message")
 
         result = await send_message(input_data)
 
         assert result is True
-        mock_telegram_client_class.assert_called_once_with(user_id=1)
-        mock_telegram_client.send_message.assert_called_once_with(
-            text="Test message", parse_mode="HTML"
-        )
-
-    @patch("the_assistant.activities.telegram_activities.send_message")
-    async def test_send_formatted_message_markdown(self, mock_send_message):
-        """Test sending formatted message with Markdown."""
-        mock_send_message.return_value = True
-
-        input_data = SendFormattedMessageInput(
-            user_id=1,
-            title="Test Title",
-            content="Test content",
-            parse_mode="Markdown",
-        )
-
-        result = await send_formatted_message(input_data)
-
-        assert result is True
-        mock_send_message.assert_called_once()
-        call_args = mock_send_message.call_args
-        assert call_args[0][0].user_id == 1
-        assert call_args[0][0].text == "**Test Title**\n\nTest content"
-        assert call_args[0][0].parse_mode == "Markdown"
-
-    @patch("the_assistant.activities.telegram_activities.send_message")
-    async def test_send_formatted_message_html(self, mock_send_message):
-        """Test sending formatted message with HTML."""
-        mock_send_message.return_value = True
-
-        input_data = SendFormattedMessageInput(
-            user_id=1,
-            title="Test Title",
-            content="Test content",
-            parse_mode="HTML",
-        )
-
-        result = await send_formatted_message(input_data)
-
-        assert result is True
-        mock_send_message.assert_called_once()
-        call_args = mock_send_message.call_args
-        assert call_args[0][0].user_id == 1
-        assert call_args[0][0].text == "<b>Test Title</b>\n\nTest content"
-        assert call_args[0][0].parse_mode == "HTML"
-
-    @patch("the_assistant.activities.telegram_activities.send_message")
-    async def test_send_formatted_message_plain_text(self, mock_send_message):
-        """Test sending formatted message with plain text."""
-        mock_send_message.return_value = True
-
+        assert telegram_client.user_ids == [1]
+        assert telegram_client.sent == [{"text": "Test message", "parse_mode": "HTML"}]
+
+    @pytest.mark.parametrize(
+        ("parse_mode", "expected_text"),
+        [
+            ("Markdown", "**Test Title**\n\nTest content"),
+            ("HTML", "<b>Test Title</b>\n\nTest content"),
+            ("None", "Test Title\n\nTest content"),
+        ],
+        ids=["markdown", "html", "plain_text"],
+    )
+    async def test_send_formatted_message(self, sent_inputs, parse_mode, expected_text):
+        """Test sending a formatted message in each parse mode."""
         input_data = SendFormattedMessageInput(
             user_id=1,
             title="Test Title",
             content="Test content",
-            parse_mode="None",
+            parse_mode=parse_mode,
         )
 
         result = await send_formatted_message(input_data)
 
         assert result is True
-        mock_send_message.assert_called_once()
-        call_args = mock_send_message.call_args
-        assert call_args[0][0].user_id == 1
-        assert call_args[0][0].text == "Test Title\n\nTest content"
-        assert call_args[0][0].parse_mode == "None"
+        assert sent_inputs == [
+            SendMessageInput(user_id=1, text=expected_text, parse_mode=parse_mode)
+        ]
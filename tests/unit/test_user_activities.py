@@ -1,8 +1,6 @@
 """Tests for user activities."""
 
-from unittest.mock import AsyncMock, patch
-
-import pytest
+from unittest.mock import patch
 
 from the_assistant.activities.user_activities import (
     GetUserAccountsInput,
@@ -10,39 +8,43 @@ from the_assistant.activities.user_activities import (
 )
 
 
-@pytest.mark.asyncio
+class StubUserService:
+    """User service stub returning fixed accounts and recording the query."""
+
+    def __init__(self, accounts: list[str]) -> None:
+        self.accounts = accounts
+        self.last: tuple[int, str] | None = None
+
+    async def get_user_accounts(self, user_id: int, provider: str) -> list[str]:
+        self.last = (user_id, provider)
+        return self.accounts
+
+
 async def test_get_user_accounts():
     """Test getting user accounts."""
-    # Mock the user service
-    mock_user_service = AsyncMock()
-    mock_user_service.get_user_accounts.return_value = ["personal", "work"]
+    user_service = StubUserService(["personal", "work"])
 
     with patch(
-        "the_assistant.activities.user_activities.get_user_service"
-    ) as mock_get_service:
-        mock_get_service.return_value = mock_user_service
-
+        "the_assistant.activities.user_activities.get_user_service",
+        return_value=user_service,
+    ):
         input_data = GetUserAccountsInput(user_id=123, provider="google")
         result = await get_user_accounts(input_data)
 
         assert result == ["personal", "work"]
-        mock_user_service.get_user_accounts.assert_called_once_with(123, "google")
+        assert user_service.last == (123, "google")
 
 
-@pytest.mark.asyncio
 async def test_get_user_accounts_empty():
     """Test getting user accounts when none exist."""
-    # Mock the user service
-    mock_user_service = AsyncMock()
-    mock_user_service.get_user_accounts.return_value = []
+    user_service = StubUserService([])
 
     with patch(
-        "the_assistant.activities.user_activities.get_user_service"
-    ) as mock_get_service:
-        mock_get_service.return_value = mock_user_service
-
+        "the_assistant.activities.user_activities.get_user_service",
+        return_value=user_service,
+    ):
         input_data = GetUserAccountsInput(user_id=123, provider="google")
         result = await get_user_accounts(input_data)
 
         assert result == []
-        mock_user_service.get_user_accounts.assert_called_once_with(123, "google")
+        assert user_service.last == (123, "google")
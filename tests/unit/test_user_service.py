@@ -1,31 +1,60 @@
 from datetime import UTC, datetime
 
 import pytest
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import StaticPool
 
 from the_assistant.db.models import Base, ThirdPartyAccount
 from the_assistant.db.service import UserService
 from the_assistant.integrations.telegram.constants import SettingKey
 
 
-@pytest.fixture
-async def session_maker(tmp_path):
-    db_path = tmp_path / "test.db"
-    engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
-    maker = async_sessionmaker(engine, expire_on_commit=False)
+@pytest.fixture(scope="session")
+async def engine():
+    # One in-memory database for the whole run; StaticPool keeps every
+    # session on the single connection that holds it.
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+
+    # pysqlite manages transactions itself and would let the SAVEPOINTs below
+    # commit; hand control to SQLAlchemy so the outer BEGIN is really emitted.
+    @event.listens_for(engine.sync_engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
-    yield maker
+    yield engine
     await engine.dispose()
 
 
+@pytest.fixture
+async def session_maker(engine):
+    # Each test runs inside an outer transaction that is rolled back at
+    # teardown; the service's commits only release SAVEPOINTs within it.
+    async with engine.connect() as conn:
+        transaction = await conn.begin()
+        yield async_sessionmaker(
+            bind=conn,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
+        await transaction.rollback()
+
+
 @pytest.fixture
 def user_service(session_maker):
     return UserService(session_maker)
 
 
-@pytest.mark.asyncio
 async def test_create_and_get_user(user_service):
     user = await user_service.create_user(username="alice", first_name="Alice")
     assert user.id is not None
@@ -36,7 +65,6 @@ async def test_create_and_get_user(user_service):
     assert fetched.first_name == "Alice"
 
 
-@pytest.mark.asyncio
 async def test_update_user(user_service):
     user = await user_service.create_user(username="bob", first_name="B")
     updated = await user_service.update_user(user.id, first_name="Bob")
@@ -47,15 +75,35 @@ async def test_update_user(user_service):
     assert fetched.first_name == "Bob"
 
 
-@pytest.mark.asyncio
-async def test_setting_management(user_service):
+@pytest.fixture
+def commits(monkeypatch):
+    """Sessions committed while the test runs, in call order."""
+    committed: list[AsyncSession] = []
+    commit = AsyncSession.commit
+
+    async def recording_commit(session: AsyncSession) -> None:
+        committed.append(session)
+        await commit(session)
+
+    monkeypatch.setattr(AsyncSession, "commit", recording_commit)
+    return committed
+
+
+async def test_setting_management(user_service, commits):
     user = await user_service.create_user(username="c")
 
-    await user_service.set_setting(user.id, SettingKey.ABOUT_ME, "Hi")
-    await user_service.set_setting(user.id, SettingKey.LOCATION, "Paris")
+    await user_service.set_settings(
+        user.id, {SettingKey.ABOUT_ME: "Hi", SettingKey.LOCATION: "Paris"}
+    )
 
     assert await user_service.get_setting(user.id, SettingKey.ABOUT_ME) == "Hi"
 
+    # Re-setting an unchanged value is a no-op: nothing is committed
+    commits.clear()
+    await user_service.set_setting(user.id, SettingKey.ABOUT_ME, "Hi")
+    assert commits == []
+    assert await user_service.get_setting(user.id, SettingKey.ABOUT_ME) == "Hi"
+
     all_settings = await user_service.get_all_settings(user.id)
     assert all_settings == {"about_me": "Hi", "location": "Paris"}
 
@@ -63,15 +111,56 @@ async def test_setting_management(user_service):
     assert await user_service.get_setting(user.id, SettingKey.ABOUT_ME) is None
 
 
-@pytest.mark.asyncio
-async def test_google_credentials_multiple_accounts(user_service):
+@pytest.fixture
+async def google_user(user_service):
+    """User with personal, work and default Google credentials."""
     user = await user_service.create_user(username="multi")
-
     await user_service.set_google_credentials(
         user.id, "cred-personal", account="personal"
     )
     await user_service.set_google_credentials(user.id, "cred-work", account="work")
     await user_service.set_google_credentials(user.id, "cred-default")
+    return user
+
+
+async def test_set_setting_overwrites_changed_value(user_service, commits):
+    user = await user_service.create_user(username="d")
+    await user_service.set_setting(user.id, SettingKey.ABOUT_ME, "Hi")
+
+    commits.clear()
+    await user_service.set_setting(user.id, SettingKey.ABOUT_ME, "Bye")
+
+    assert len(commits) == 1
+    assert await user_service.get_setting(user.id, SettingKey.ABOUT_ME) == "Bye"
+
+
+async def test_set_settings_mixed_batch(user_service, commits):
+    """New, changed and unchanged keys are written in a single commit."""
+    user = await user_service.create_user(username="e")
+    await user_service.set_settings(
+        user.id, {SettingKey.ABOUT_ME: "Hi", SettingKey.LOCATION: "Paris"}
+    )
+
+    commits.clear()
+    await user_service.set_settings(
+        user.id,
+        {
+            SettingKey.ABOUT_ME: "Hi",
+            SettingKey.LOCATION: "Berlin",
+            SettingKey.GREET: "username",
+        },
+    )
+
+    assert len(commits) == 1
+    assert await user_service.get_all_settings(user.id) == {
+        "about_me": "Hi",
+        "location": "Berlin",
+        "greet": "username",
+    }
+
+
+async def test_google_credentials_multiple_accounts(user_service, google_user):
+    user = google_user
 
     assert (
         await user_service.get_google_credentials(user.id, account="personal")
@@ -96,33 +185,29 @@ async def test_google_credentials_multiple_accounts(user_service):
         }
 
 
-@pytest.mark.asyncio
-async def test_get_user_accounts(user_service):
+@pytest.mark.parametrize(
+    ("provider", "expected"),
+    [("google", {"personal", "work", "default"}), ("other", set())],
+    ids=["google", "unknown_provider"],
+)
+async def test_get_user_accounts(user_service, google_user, provider, expected):
     """Test getting all accounts for a user and provider."""
-    user = await user_service.create_user(username="accounts_test")
-
-    # Set up multiple Google accounts
-    await user_service.set_google_credentials(
-        user.id, "cred-personal", account="personal"
-    )
-    await user_service.set_google_credentials(user.id, "cred-work", account="work")
-    await user_service.set_google_credentials(user.id, "cred-default")
-
-    # Test getting Google accounts
-    google_accounts = await user_service.get_user_accounts(user.id, "google")
-    assert set(google_accounts) == {"personal", "work", "default"}
-
-    # Test with non-existent provider
-    other_accounts = await user_service.get_user_accounts(user.id, "other")
-    assert other_accounts == []
+    # An account without credentials is never listed
+    async with user_service._session_maker() as session:
+        session.add(
+            ThirdPartyAccount(
+                user_id=google_user.id,
+                provider="google",
+                account="no_creds",
+                credentials_enc=None,
+            )
+        )
+        await session.commit()
 
-    # Test with account that has no credentials (should be excluded)
-    await user_service._set_third_party_credentials(user.id, "google", None, "no_creds")
-    google_accounts_after = await user_service.get_user_accounts(user.id, "google")
-    assert set(google_accounts_after) == {"personal", "work", "default"}
+    accounts = await user_service.get_user_accounts(google_user.id, provider)
+    assert set(accounts) == expected
 
 
-@pytest.mark.asyncio
 async def test_task_creation_and_listing(user_service):
     user = await user_service.create_user(username="taskuser")
 
@@ -139,7 +224,6 @@ async def test_task_creation_and_listing(user_service):
     assert tasks[0].raw_instruction == "every day at 6pm say hi"
 
 
-@pytest.mark.asyncio
 async def test_countdown_creation_and_listing(user_service):
     user = await user_service.create_user(username="countuser")
 
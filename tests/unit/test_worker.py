@@ -1,9 +1,7 @@
 """Tests for the Temporal worker."""
 
-import asyncio
 import logging
-import os
-from unittest.mock import AsyncMock, patch
+from unittest.mock import patch
 
 import pytest
 
@@ -16,21 +14,37 @@ pytestmark = pytest.mark.filterwarnings(
 )
 
 
+class StubWorker:
+    """Stand-in for a Temporal ``Worker`` whose ``run`` raises ``error`` if set."""
+
+    def __init__(self) -> None:
+        self.error: BaseException | None = None
+        self.runs = 0
+
+    async def run(self) -> None:
+        self.runs += 1
+        if self.error is not None:
+            raise self.error
+
+
 class TestWorker:
     """Test the Temporal worker."""
 
+    @pytest.fixture(autouse=True)
+    def worker_env(self, monkeypatch):
+        """Secrets the worker requires at startup."""
+        monkeypatch.setenv("DB_ENCRYPTION_KEY", "key")
+        monkeypatch.setenv("JWT_SECRET", "secret")
+
     @pytest.fixture
-    def mock_temporal_client(self):
-        """Mock Temporal client."""
-        client = AsyncMock()
-        return client
+    def temporal_client(self):
+        """Opaque stand-in for the connected Temporal client."""
+        return object()
 
     @pytest.fixture
-    def mock_worker(self):
-        """Mock Temporal worker."""
-        worker = AsyncMock()
-        worker.run = AsyncMock()
-        return worker
+    def stub_worker(self):
+        """Stub Temporal worker."""
+        return StubWorker()
 
     @patch("the_assistant.worker.Client.connect")
     @patch("the_assistant.worker.Worker")
@@ -38,35 +52,20 @@ class TestWorker:
         self,
         mock_worker_class,
         mock_client_connect,
-        mock_temporal_client,
-        mock_worker,
+        temporal_client,
+        stub_worker,
+        monkeypatch,
     ):
         """Test successful worker startup."""
-        mock_client_connect.return_value = mock_temporal_client
-        mock_worker_class.return_value = mock_worker
-
-        # Mock environment variables
-        with patch.dict(
-            os.environ,
-            {
-                "TEMPORAL_HOST": "test-host:7233",
-                "TEMPORAL_TASK_QUEUE": "test-queue",
-                "DB_ENCRYPTION_KEY": "key",
-                "JWT_SECRET": "secret",
-            },
-        ):
-            # Run worker for a short time then stop
-            async def stop_worker():
-                await asyncio.sleep(0.1)
-                mock_worker.run.side_effect = KeyboardInterrupt()
-
-            task = asyncio.create_task(run_worker())
-            stop_task = asyncio.create_task(stop_worker())
-
-            try:
-                await asyncio.gather(task, stop_task)
-            except KeyboardInterrupt:
-                pass  # Expected
+        mock_client_connect.return_value = temporal_client
+        mock_worker_class.return_value = stub_worker
+
+        monkeypatch.setenv("TEMPORAL_HOST", "test-host:7233")
+        monkeypatch.setenv("TEMPORAL_TASK_QUEUE", "test-queue")
+
+        await run_worker()
+
+        assert stub_worker.runs == 1
 
         # Verify client connection
         mock_client_connect.assert_called_once()
@@ -76,7 +75,7 @@ class TestWorker:
         # Verify worker creation
         mock_worker_class.assert_called_once()
         worker_args = mock_worker_class.call_args
-        assert worker_args[0][0] == mock_temporal_client
+        assert worker_args[0][0] == temporal_client
         assert worker_args[1]["task_queue"] == "test-queue"
 
         # Check that activities are registered
@@ -92,16 +91,8 @@ class TestWorker:
         """Test worker startup with connection error."""
         mock_client_connect.side_effect = Exception("Connection failed")
 
-        with patch.dict(
-            os.environ,
-            {
-                "DB_ENCRYPTION_KEY": "key",
-                "JWT_SECRET": "secret",
-            },
-            clear=True,
-        ):
-            with pytest.raises(Exception, match="Connection failed"):
-                await run_worker()
+        with pytest.raises(Exception, match="Connection failed"):
+            await run_worker()
 
     @patch("the_assistant.worker.Client.connect")
     @patch("the_assistant.worker.Worker")
@@ -109,26 +100,18 @@ class TestWorker:
         self,
         mock_worker_class,
         mock_client_connect,
-        mock_temporal_client,
-        mock_worker,
+        temporal_client,
+        stub_worker,
     ):
         """Test worker graceful shutdown on keyboard interrupt."""
-        mock_client_connect.return_value = mock_temporal_client
-        mock_worker_class.return_value = mock_worker
-        mock_worker.run.side_effect = KeyboardInterrupt()
-
-        with patch.dict(
-            os.environ,
-            {
-                "DB_ENCRYPTION_KEY": "key",
-                "JWT_SECRET": "secret",
-            },
-            clear=True,
-        ):
-            # Should not raise exception, just log and exit gracefully
-            await run_worker()
+        mock_client_connect.return_value = temporal_client
+        mock_worker_class.return_value = stub_worker
+        stub_worker.error = KeyboardInterrupt()
+
+        # Should not raise exception, just log and exit gracefully
+        await run_worker()
 
-        mock_worker.run.assert_called_once()
+        assert stub_worker.runs == 1
 
     @patch("the_assistant.worker.Client.connect")
     @patch("the_assistant.worker.Worker")
@@ -136,24 +119,16 @@ class TestWorker:
         self,
         mock_worker_class,
         mock_client_connect,
-        mock_temporal_client,
-        mock_worker,
+        temporal_client,
+        stub_worker,
     ):
         """Test worker handling of runtime errors."""
-        mock_client_connect.return_value = mock_temporal_client
-        mock_worker_class.return_value = mock_worker
-        mock_worker.run.side_effect = RuntimeError("Worker failed")
-
-        with patch.dict(
-            os.environ,
-            {
-                "DB_ENCRYPTION_KEY": "key",
-                "JWT_SECRET": "secret",
-            },
-            clear=True,
-        ):
-            with pytest.raises(RuntimeError, match="Worker failed"):
-                await run_worker()
+        mock_client_connect.return_value = temporal_client
+        mock_worker_class.return_value = stub_worker
+        stub_worker.error = RuntimeError("Worker failed")
+
+        with pytest.raises(RuntimeError, match="Worker failed"):
+            await run_worker()
 
     def test_worker_activities_imported(self):
         """Test that all required activities are imported."""
@@ -177,6 +152,8 @@ class TestWorker:
         main()
 
         mock_asyncio_run.assert_called_once()
+        # Close the run_worker() coroutine that was never scheduled
+        mock_asyncio_run.call_args.args[0].close()
 
     @patch("the_assistant.worker.logging.basicConfig")
     @patch("the_assistant.worker.Client.connect")
@@ -186,30 +163,21 @@ class TestWorker:
         mock_worker_class,
         mock_client_connect,
         mock_logging_config,
-        mock_temporal_client,
-        mock_worker,
+        temporal_client,
+        stub_worker,
     ):
         """Test that logging is configured during worker startup."""
-        mock_client_connect.return_value = mock_temporal_client
-        mock_worker_class.return_value = mock_worker
-
-        mock_worker.run.side_effect = KeyboardInterrupt()
-        with patch.dict(
-            os.environ,
-            {
-                "DB_ENCRYPTION_KEY": "key",
-                "JWT_SECRET": "secret",
-            },
-            clear=True,
-        ):
-            await run_worker()
+        mock_client_connect.return_value = temporal_client
+        mock_worker_class.return_value = stub_worker
+
+        stub_worker.error = KeyboardInterrupt()
+        await run_worker()
 
         mock_logging_config.assert_called()
         call_args = mock_logging_config.call_args
         assert "level" in call_args[1]
         assert "format" in call_args[1]
 
-    @patch.dict(os.environ, {"LOG_LEVEL": "DEBUG"})
     @patch("the_assistant.worker.logging.basicConfig")
     @patch("the_assistant.worker.Client.connect")
     @patch("the_assistant.worker.Worker")
@@ -218,23 +186,17 @@ class TestWorker:
         mock_worker_class,
         mock_client_connect,
         mock_logging_config,
-        mock_temporal_client,
-        mock_worker,
+        temporal_client,
+        stub_worker,
+        monkeypatch,
     ):
         """Test that logging level is read from environment."""
-        mock_client_connect.return_value = mock_temporal_client
-        mock_worker_class.return_value = mock_worker
-
-        mock_worker.run.side_effect = KeyboardInterrupt()
-        with patch.dict(
-            os.environ,
-            {
-                "DB_ENCRYPTION_KEY": "key",
-                "JWT_SECRET": "secret",
-            },
-            clear=False,
-        ):
-            await run_worker()
+        monkeypatch.setenv("LOG_LEVEL", "DEBUG")
+        mock_client_connect.return_value = temporal_client
+        mock_worker_class.return_value = stub_worker
+
+        stub_worker.error = KeyboardInterrupt()
+        await run_worker()
 
         mock_logging_config.assert_called()
         call_args = mock_logging_config.call_args